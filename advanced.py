@@ -10,6 +10,7 @@ Advanced Voice Assistant with additional features
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import time
 import json
 import datetime
 from pathlib import Path
@@ -28,6 +29,8 @@ class AdvancedVoiceAssistant:
         # Initialize components
         self.voice_engine = VoiceEngine()
         self.command_processor = CommandProcessor(self.voice_engine)
+        # (second, "HH:MM:SS") of the last log line; reused within a second
+        self._log_ts = (0, "")
         
         # Data storage
         self.config_dir = Path.home() / ".voice_assistant"
@@ -346,7 +349,11 @@ All code is available for customization.
     
     def log(self, message: str):
         """Add message to log."""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        now = int(time.time())
+        sec, timestamp = self._log_ts
+        if now != sec:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._log_ts = (now, timestamp)
         log_msg = f"[{timestamp}] {message}\n"
         
         self.log_text.config(state=tk.NORMAL)
@@ -4,6 +4,7 @@ from lib.voice_engine import VoiceEngine
 from lib.command_processor import CommandProcessor
 from lib.utilities import search_web, get_weather, open_application, execute_system_command
 from lib.gesture_controller import GestureController
+from lib.camera import open_camera
 
 __all__ = [
     'VoiceEngine',
@@ -13,4 +14,5 @@ __all__ = [
     'open_application',
     'execute_system_command',
     'GestureController',
+    'open_camera',
 ]
@@ -0,0 +1,29 @@
+"""Camera helpers shared by the camera tab and the gesture controller."""
+
+import sys
+from typing import Optional
+
+
+def open_camera(cv2, index: int, width: Optional[int] = None, height: Optional[int] = None):
+    """Open camera `index` with an explicit backend and an MJPG stream.
+
+    cv2 is passed in because both callers import OpenCV lazily. DirectShow/V4L2
+    open faster than the auto-picked backend, MJPG avoids raw YUY2 over USB,
+    and a 1-frame buffer keeps latency low. width/height are only requested
+    when given; otherwise the driver default resolution is kept.
+    """
+    backend = cv2.CAP_DSHOW if sys.platform == "win32" else cv2.CAP_V4L2
+    cap = cv2.VideoCapture(index, backend)
+    if not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(index)
+    if cap.isOpened():
+        try:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            if width and height:
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        except Exception:
+            pass
+    return cap
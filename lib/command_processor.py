@@ -1,25 +1,26 @@
 """Command processor for the personal assistant."""
 
-from random import random
+import random
 import re
 import webbrowser
 import subprocess
 import datetime
 import os
+import urllib.parse
 # Instead of just 'import pywhatkit', use this:
 try:
     import pywhatkit
 except Exception as e:
     print(f"Warning: pywhatkit failed to load (Internet issue). Some features will be disabled. Error: {e}")
     pywhatkit = None
-from click import command
-from click import command
 import pyautogui
 import platform
 from typing import Dict, Callable, Optional
 
-from requests import options
-import wikipedia
+try:
+    import wikipedia
+except Exception:
+    wikipedia = None
 from lib.utilities import search_web, get_weather, open_application, execute_system_command
 
 class CommandProcessor:
@@ -111,7 +112,6 @@ class CommandProcessor:
         # Only trigger when the name is actually used, to avoid false positives
         if "friday" in command:
             # Short, natural acknowledgement with casual flavor
-            import random
             responses = [
                 "Uhm, yes sir, what's up?",
                 "Yeah bro, what can I do for you?",
@@ -126,7 +126,6 @@ class CommandProcessor:
 
     def say_goodbye(self, command: str):
         """Simple polite exit phrase."""
-        import random
         responses = [
             "Uhm, later bro! I'll be here when you need me.",
             "See you later, dude!",
@@ -238,7 +237,6 @@ class CommandProcessor:
             return True
         
         # Casual fallback for unrecognized commands
-        import random
         responses = [
             "Uhm, I didn't catch that, bro.",
             "Sorry dude, I didn't understand that.",
@@ -252,7 +250,6 @@ class CommandProcessor:
 
     def start_chat_mode(self, command: str):
         """Enter a chill chat flow and ask for favorites."""
-        import random
         self.conversation_mode = True
         openers = [
             "Uhm, alright bro. Let's chat. Quick question—what's your favorite song?",
@@ -292,7 +289,6 @@ class CommandProcessor:
         if q:
             self.preferences[q] = answer
 
-        import random
         acks = [
             "Nice, bro.",
             "Okay dude, got you.",
@@ -320,7 +316,6 @@ class CommandProcessor:
 
     def handle_bored(self, command: str):
         """When user says they're bored, do something based on favorites."""
-        import random
 
         # Use chatbot preferences if available, otherwise use command processor preferences
         if self.chatbot and self.chatbot.user_preferences:
@@ -350,8 +345,6 @@ class CommandProcessor:
             except Exception:
                 # fallback to web search/open
                 try:
-                    import webbrowser
-                    import urllib.parse
                     q = urllib.parse.quote(fav_song)
                     webbrowser.open(f"https://www.youtube.com/results?search_query={q}")
                 except Exception:
@@ -374,8 +367,6 @@ class CommandProcessor:
         if fav_verse and fav_verse != "none":
             self.voice_engine.speak("Uhm, let's pull up a verse real quick, bro.")
             try:
-                import webbrowser
-                import urllib.parse
                 q = urllib.parse.quote(fav_verse)
                 webbrowser.open(f"https://www.biblegateway.com/quicksearch/?quicksearch={q}&version=NIV")
             except Exception:
@@ -397,7 +388,6 @@ class CommandProcessor:
             # "I would..." hypothetical answers
             r'^i would (go|travel|visit|choose|pick)',
         ]
-        import re
         for pattern in casual_patterns:
             if re.match(pattern, text, re.IGNORECASE):
                 return True
@@ -405,7 +395,6 @@ class CommandProcessor:
     
     def _add_casual_flavor(self, text: str) -> str:
         """Add casual filler words and make it sound more chill."""
-        import random
         fillers = ["uhm", "uh", "like", "you know"]
         casual_terms = ["bro", "dude", "man"]
         
@@ -468,7 +457,6 @@ class CommandProcessor:
                 "Cool, man.",
             ]
         
-        import random
         response = random.choice(responses)
         # Sometimes add extra casual flavor
         if random.random() < 0.4:
@@ -491,7 +479,6 @@ class CommandProcessor:
     
     def greet(self, command: str):
         """Greet the user."""
-        import random
         hour = datetime.datetime.now().hour
         if hour < 12:
             greetings = [
@@ -670,13 +657,11 @@ class CommandProcessor:
         
         # 1. Primary Method: Try pywhatkit for auto-play
         try:
-            import pywhatkit
             # Note: pywhatkit can sometimes hang if the internet is slow
             pywhatkit.playonyt(query)
         except Exception as e:
             print(f"Pywhatkit error: {e}")
             # 2. Fallback Method: Standard browser search (Super stable on Kali)
-            import webbrowser
             url = f"https://www.youtube.com/results?search_query={query}"
             webbrowser.open(url)
      else:
@@ -686,12 +671,6 @@ class CommandProcessor:
         self.voice_engine.stop_speaking()
     
 
-    # Wikipedia is used by perform_research; import if available
-    try:
-        import wikipedia
-    except Exception:
-        wikipedia = None
-
     def perform_research(self, topic: str):
         """Fetch a short summary about a topic using Wikipedia when available."""
         if not topic:
@@ -713,8 +692,6 @@ class CommandProcessor:
         else:
             self.voice_engine.speak("Wikipedia is not available in this environment.")
 
-    import random
-
     def start_game(self, command: str):
         self.voice_engine.speak("I have two games: Guess the Number or Rock Paper Scissors. Which one do you want?")
 
@@ -784,8 +761,4 @@ class CommandProcessor:
             
         except Exception as e:
             print(f"Error starting XO game: {e}")
-            self.voice_engine.speak("I couldn't start the game. Sorry!")
-
-    def silence_assistant(self, command: str):
-        """Stops any active TTS playback."""
-        self.voice_engine.stop_speaking()
\ No newline at end of file
+            self.voice_engine.speak("I couldn't start the game. Sorry!")
\ No newline at end of file
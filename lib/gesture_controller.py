@@ -1,13 +1,24 @@
 import threading
 import time
 
-# Optional heavy imports – we don't want the whole app to crash if missing
-try:
-    import cv2
-    import mediapipe as mp
-except Exception:
-    cv2 = None
-    mp = None
+from lib.camera import open_camera
+
+# Optional heavy imports – we don't want the whole app to crash if missing.
+# Loaded on first GestureController() so importing this module stays cheap.
+cv2 = None
+mp = None
+
+
+def _load_deps() -> bool:
+    global cv2, mp
+    if cv2 is None or mp is None:
+        try:
+            import cv2 as _cv2
+            import mediapipe as _mp
+        except Exception:
+            return False
+        cv2, mp = _cv2, _mp
+    return True
 
 
 class GestureController:
@@ -59,7 +70,7 @@ class GestureController:
         self._stop = threading.Event()
         self._thread = None
 
-        if not cv2 or not mp:
+        if not _load_deps():
             # Dependencies not available – no-op controller
             self._emit_status("Gesture controller disabled (missing cv2/mediapipe).")
             return
@@ -121,7 +132,8 @@ class GestureController:
         if not cv2 or not mp:
             return
 
-        cap = cv2.VideoCapture(int(self.camera_index))
+        # Resolution is left at the driver default; MediaPipe doesn't need more.
+        cap = open_camera(cv2, int(self.camera_index))
         if not cap.isOpened():
             # Camera not available
             self._emit_status(f"Camera {self.camera_index} could not be opened.")
@@ -1,6 +1,12 @@
 import os
 import time
 import json
+import collections
+import re
+import functools
+import hashlib
+import shutil
+import subprocess
 import threading
 import tempfile
 import queue
@@ -27,11 +33,53 @@ try:
 except Exception:
     pocketsphinx = None
 
+try:
+    import audioop  # stdlib <= 3.12, audioop-lts on 3.13+
+except Exception:
+    audioop = None
+
 try:
     import pyttsx3
 except Exception:
     pyttsx3 = None
 
+# Keyphrase handed to pocketsphinx; it echoes it back verbatim (lowercase),
+# so detections can be matched without lowercasing each output line.
+_WAKE_WORD = "friday"
+# Compiled once and matched as a whole word, so e.g. "fridays" in spotter
+# output doesn't count as a detection.
+_WAKE_RE = re.compile(r"\b" + _WAKE_WORD + r"\b")
+
+
+# How many "Google heard nothing" fingerprints listen_for_command remembers.
+_NOISE_FP_MAX = 256
+
+
+def _audio_fingerprint(audio) -> Optional[bytes]:
+    """Coarse fingerprint of a capture: its loudness envelope in 100 ms steps,
+    bucketed by powers of two, so a repeat of the same knock or chime hashes
+    the same. None when audioop isn't available."""
+    if audioop is None:
+        return None
+    try:
+        raw = audio.get_raw_data()
+        width = audio.sample_width
+        step = (audio.sample_rate // 10) * width
+        envelope = bytes(
+            audioop.rms(raw[i:i + step], width).bit_length()
+            for i in range(0, len(raw) - step + 1, step)
+        )
+    except Exception:
+        return None
+    return hashlib.blake2b(envelope, digest_size=12).digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Memoised shutil.which; PATH doesn't change while Friday runs."""
+    return shutil.which(name)
+
+
 class VoiceEngine:
     """Handles speech-to-text and thread-safe text-to-speech for Kali Linux.
 
@@ -59,13 +107,9 @@ class VoiceEngine:
             self.recognizer.pause_threshold = 0.5 
             self.recognizer.non_speaking_duration = 0.4
 
-        # 3. Mixer Init
-        try:
-            if pygame and not pygame.mixer.get_init():
-                pygame.mixer.pre_init(44100, -16, 2, 2048)
-                pygame.mixer.init()
-        except Exception as e:
-            print(f"Mixer Init Error: {e}")
+        # 3. Mixer: opened by _ensure_mixer() on the first pygame playback, so
+        # startup doesn't pay for the audio device (pyttsx3 may never need it).
+        self._mixer_ready = False
 
         # 4. Microphone initialization (config‑driven, with fallbacks)
         self.mic = None
@@ -76,24 +120,49 @@ class VoiceEngine:
             desired_index = mic_cfg.get("device_index")
             desired_rate = mic_cfg.get("sample_rate") or None  # None => library default
 
+            # One PortAudio session for the whole scan. sr.Microphone starts
+            # PortAudio in its constructor and again on every `with`, so
+            # probing candidates through it re-enumerated every device two
+            # more times per candidate.
+            try:
+                pa = sr.Microphone.get_pyaudio().PyAudio()
+            except Exception as e:
+                print(f"Could not start PortAudio: {e}")
+                pa = None
+
             def try_device(index: int, label: Optional[str] = None) -> bool:
                 """Attempt to open a microphone on the given index and validate the ALSA stream.
 
-                We explicitly open the context once here so that if ALSA/PortAudio
+                We explicitly open the stream once here so that if ALSA/PortAudio
                 rejects the parameters (channelCount/maxChans issues, busy device, etc.),
                 the failure happens only during initialization instead of spamming
                 errors every time we call listen().
                 """
                 try:
-                    kwargs = {}
-                    if desired_rate:
-                        kwargs["sample_rate"] = int(desired_rate)
+                    rate = int(desired_rate) if desired_rate else None
                     pretty_label = f" ({label})" if label else ""
                     print(f"Trying input device {index}{pretty_label}...")
-                    mic = sr.Microphone(device_index=index, **kwargs)
-                    # Validate that ALSA can actually open the stream
-                    with mic as source:
-                        _ = source  # no‑op, just force stream open/close
+                    if pa is not None:
+                        info = pa.get_device_info_by_index(index)
+                        if info.get("maxInputChannels", 0) < 1:
+                            raise OSError("not an input device")
+                        rate = rate or int(info["defaultSampleRate"])
+                        # Same parameters sr.Microphone opens the stream with.
+                        stream = pa.open(
+                            format=pa.get_format_from_width(2),
+                            channels=1,
+                            rate=rate,
+                            input=True,
+                            input_device_index=index,
+                            frames_per_buffer=1024,
+                        )
+                        stream.close()
+                        mic = sr.Microphone(device_index=index, sample_rate=rate)
+                    else:
+                        mic = sr.Microphone(device_index=index, **({"sample_rate": rate} if rate else {}))
+                        # Validate that ALSA can actually open the stream
+                        with mic as source:
+                            _ = source  # no‑op, just force stream open/close
                     self.mic = mic
                     self.mic_device_index = index
                     print(f"Microphone locked on index {index}{pretty_label}.")
@@ -102,33 +171,75 @@ class VoiceEngine:
                     print(f"Device {index} failed: {e}")
                     return False
 
-            # 1) Try the index from config.json, if present
-            if isinstance(desired_index, int) and desired_index >= 0:
-                if not try_device(desired_index, "config"):
-                    self.mic = None
-
-            # 2) If that failed or no index configured, scan for a sensible default
-            if self.mic is None:
-                try:
-                    names = sr.Microphone.list_microphone_names()
-                except Exception as e:
-                    print(f"Could not enumerate microphones: {e}")
-                    names = []
+            try:
+                # 1) Try the index from config.json, if present
+                if isinstance(desired_index, int) and desired_index >= 0:
+                    if not try_device(desired_index, "config"):
+                        self.mic = None
 
-                for idx, name in enumerate(names):
-                    name_l = (name or "").lower()
-                    # Prefer PulseAudio/Default/USB/headset style devices, skip HDMI sinks
-                    if any(k in name_l for k in ("pulse", "default", "usb", "mic", "input")) \
-                       and not any(h in name_l for h in ("hdmi", "monitor")):
-                        if try_device(idx, name):
-                            break
+                # 2) If that failed or no index configured, scan for a sensible default
+                if self.mic is None:
+                    try:
+                        if pa is not None:
+                            names = []
+                            for i in range(pa.get_device_count()):
+                                info = pa.get_device_info_by_index(i)
+                                # Output-only devices are never candidates.
+                                names.append(info.get("name") if info.get("maxInputChannels", 0) > 0 else None)
+                        else:
+                            names = sr.Microphone.list_microphone_names()
+                    except Exception as e:
+                        print(f"Could not enumerate microphones: {e}")
+                        names = []
+
+                    for idx, name in enumerate(names):
+                        if name is None:
+                            continue
+                        name_l = name.lower()
+                        # Prefer PulseAudio/Default/USB/headset style devices, skip HDMI sinks
+                        if any(k in name_l for k in ("pulse", "default", "usb", "mic", "input")) \
+                           and not any(h in name_l for h in ("hdmi", "monitor")):
+                            if try_device(idx, name):
+                                break
+            finally:
+                if pa is not None:
+                    try:
+                        pa.terminate()
+                    except Exception:
+                        pass
 
             if self.mic is None:
                 print("Hardware initialization failed: no usable audio input device found.")
 
         # 5. TTS Settings & Threading
         self.tts_queue = queue.Queue()
+        # Rendered gTTS clips waiting for the playback thread, so the next
+        # utterance is fetched while the current one plays. Bounded so a long
+        # backlog doesn't pile up temp files.
+        self._playback_queue = queue.Queue(maxsize=2)
         self.stop_event = threading.Event()
+        # Bumped by stop_speaking(); clips rendered for an older generation
+        # are dropped instead of played.
+        self._tts_generation = 0
+        # Set while nothing is being spoken; listeners wait on it instead of
+        # polling pygame.mixer.music.get_busy(). Cleared by speak() and set
+        # again once every queued utterance has been played or dropped.
+        self.audio_idle = threading.Event()
+        self.audio_idle.set()
+        self._tts_pending = 0
+        self._tts_pending_lock = threading.Lock()
+        # Long-running `pocketsphinx kws` process used by start_wake_word().
+        self._kws_proc: Optional[subprocess.Popen] = None
+        # In-process fallback spotter (pocketsphinx Decoder fed from the mic).
+        self._kws_thread: Optional[threading.Thread] = None
+        self._kws_stop = threading.Event()
+        self._kws_failures = 0
+        # Fingerprint -> times Google returned nothing for it (LRU order).
+        self._noise_fps: collections.OrderedDict = collections.OrderedDict()
+        # Phrases registered via speak(..., cache=True).
+        self._cached_phrases: set = set()
+        # paplay/pw-play process for the utterance currently being spoken.
+        self._player_proc: Optional[subprocess.Popen] = None
         
         sr_cfg = (cfg or {}).get('speech_recognition', {})
         self.sr_timeout = int(sr_cfg.get('timeout', 10))
@@ -147,8 +258,9 @@ class VoiceEngine:
             except Exception:
                 pass
 
-        # Start the TTS processing thread
+        # Start the TTS processing and playback threads
         threading.Thread(target=self._process_tts_queue, daemon=True).start()
+        threading.Thread(target=self._process_playback_queue, daemon=True).start()
 
     def listen_for_command(self):
         """Hardened listener to prevent crashes on ALSA/Hardware failure."""
@@ -185,17 +297,31 @@ class VoiceEngine:
                     print(f"Capture error: {e}")
                     return None
 
-                # 3. Recognition
+                # 3. Recognition. A capture that sounds like one Google
+                # has already found no words in twice skips the round trip
+                # and goes straight to the local fallback. One miss isn't
+                # enough: a user repeating a mumbled command produces the
+                # same coarse envelope, and that retry must still reach
+                # Google. Without the fallback the skip would drop the
+                # capture outright, so Google is always asked then.
+                fp = _audio_fingerprint(audio) if pocketsphinx else None
                 try:
-                    return self.recognizer.recognize_google(audio).lower()
+                    if fp is None or self._noise_fps.get(fp, 0) < 2:
+                        return self.recognizer.recognize_google(audio).lower()
+                    self._noise_fps.move_to_end(fp)
                 except sr.UnknownValueError:
-                    # Fallback to Sphinx if internet/Google fails
-                    if pocketsphinx:
-                        try:
-                            return self.recognizer.recognize_sphinx(audio).lower()
-                        except Exception:
-                            return None
-                    return None
+                    if fp is not None:
+                        self._noise_fps[fp] = self._noise_fps.get(fp, 0) + 1
+                        self._noise_fps.move_to_end(fp)
+                        if len(self._noise_fps) > _NOISE_FP_MAX:
+                            self._noise_fps.popitem(last=False)
+                # Fallback to Sphinx if internet/Google fails
+                if pocketsphinx:
+                    try:
+                        return self.recognizer.recognize_sphinx(audio).lower()
+                    except Exception:
+                        return None
+                return None
                     
         except Exception as e:
             # This catches the 'NoneType' close error and 'Audio source' error
@@ -205,13 +331,52 @@ class VoiceEngine:
                 print(f"Unexpected Mic Error: {e}")
             return None
 
-    def speak(self, text: str):
-        """Adds text to the speech queue. Call this from any thread."""
+    def speak(self, text: str, cache: bool = False):
+        """Adds text to the speech queue. Call this from any thread.
+
+        cache=True marks a fixed phrase whose rendered audio can be kept on
+        disk and replayed; don't use it for dynamic text.
+        """
         if not text or not text.strip():
             return
+        if cache:
+            self._cached_phrases.add(text)
         print(f"Queueing: {text}")
+        with self._tts_pending_lock:
+            self._tts_pending += 1
+            self.audio_idle.clear()
         self.tts_queue.put(text)
 
+    def _utterance_done(self):
+        """Marks one queued utterance as played or dropped."""
+        with self._tts_pending_lock:
+            self._tts_pending = max(0, self._tts_pending - 1)
+            if self._tts_pending == 0:
+                self.audio_idle.set()
+
+    def _process_playback_queue(self):
+        """Plays rendered clips handed over by the TTS thread, in order."""
+        while True:
+            filename, temporary, generation = self._playback_queue.get()
+            try:
+                # Clear first, then check: stop_speaking() bumps the
+                # generation before setting the event, so a stop landing
+                # after the check still sets the event _play_file watches.
+                # Checking first could clear a stop that came in between.
+                self.stop_event.clear()
+                if generation == self._tts_generation:
+                    if not self._play_file(filename):
+                        print('No audio player available for', filename)
+            except Exception as e:
+                print('playback error:', e)
+            finally:
+                if temporary:
+                    try:
+                        os.remove(filename)
+                    except OSError:
+                        pass
+                self._utterance_done()
+
     def _process_tts_queue(self):
         """gTTS playback thread. If gTTS/pygame missing, log and drain queue."""
         # lazy-init engine inside the TTS thread to avoid cross-thread issues
@@ -246,20 +411,17 @@ class VoiceEngine:
             except Exception:
                 pyttsx3_engine = None
         while True:
+            handed_off = False
             try:
                 text = self.tts_queue.get()
                 if text is None:
                     break
+                generation = self._tts_generation
                 # If configured to prefer online TTS and gTTS+pygame are available, use that first
                 if self.prefer_online_tts and gTTS and pygame:
                     try:
                         # ensure mixer is initialized with correct sample rate
-                        try:
-                            if not pygame.mixer.get_init():
-                                pygame.mixer.pre_init(44100, -16, 2, 2048)
-                                pygame.mixer.init()
-                        except Exception:
-                            pass
+                        self._ensure_mixer()
 
                         filename = None
                         try:
@@ -284,57 +446,18 @@ class VoiceEngine:
                                 # save to cache if possible
                                 try:
                                     if fn:
-                                        import shutil
                                         shutil.copyfile(filename, fn)
                                 except Exception:
                                     pass
-                            try:
-                                # Prefer system PulseAudio/PipeWire player if available
-                                from shutil import which
-                                paplay = which('paplay') or which('pw-play')
-                                if paplay:
-                                    try:
-                                        import subprocess
-                                        subprocess.run([paplay, filename], check=False)
-                                    except Exception as e:
-                                        print('paplay/pw-play failed, falling back to pygame:', e)
-                                        pygame.mixer.music.load(filename)
-                                        pygame.mixer.music.set_volume(float(self.tts_volume))
-                                        pygame.mixer.music.play()
-                                        while pygame.mixer.music.get_busy():
-                                            if self.stop_event.is_set():
-                                                try:
-                                                    pygame.mixer.music.stop()
-                                                except Exception:
-                                                    pass
-                                                break
-                                            time.sleep(0.1)
-                                        try:
-                                            pygame.mixer.music.unload()
-                                        except Exception:
-                                            pass
-                                else:
-                                    pygame.mixer.music.load(filename)
-                                    pygame.mixer.music.set_volume(float(self.tts_volume))
-                                    pygame.mixer.music.play()
-                                    while pygame.mixer.music.get_busy():
-                                        if self.stop_event.is_set():
-                                            try:
-                                                pygame.mixer.music.stop()
-                                            except Exception:
-                                                pass
-                                            break
-                                        time.sleep(0.1)
-                                    try:
-                                        pygame.mixer.music.unload()
-                                    except Exception:
-                                        pass
-                            except Exception as e:
-                                print('pygame playback error for gTTS:', e)
+                            # Playback runs on its own thread; this one moves
+                            # on to rendering the next utterance meanwhile.
+                            temporary = not (cache_dir and filename.startswith(cache_dir))
+                            self._playback_queue.put((filename, temporary, generation))
+                            handed_off = True
                         finally:
-                            # if we created a temp file that's not the cached file, remove it
+                            # if we created a temp file that never reached playback, remove it
                             try:
-                                if filename and cache_dir and not filename.startswith(cache_dir):
+                                if filename and not handed_off and cache_dir and not filename.startswith(cache_dir):
                                     if os.path.exists(filename):
                                         os.remove(filename)
                             except Exception:
@@ -373,9 +496,17 @@ class VoiceEngine:
                             except Exception:
                                 pass
 
-                        # Speak the phrase. Respect stop_event by stopping the engine if triggered.
-                        pyttsx3_engine.say(text)
-                        pyttsx3_engine.runAndWait()
+                        # Fixed phrases (greetings etc.) replay a rendered wav
+                        # instead of being synthesised again on every launch.
+                        cached = (
+                            text in self._cached_phrases
+                            and cache_dir
+                            and self._speak_cached_pyttsx3(pyttsx3_engine, text, cache_dir)
+                        )
+                        if not cached:
+                            # Speak the phrase. Respect stop_event by stopping the engine if triggered.
+                            pyttsx3_engine.say(text)
+                            pyttsx3_engine.runAndWait()
                         # reset stop_event after successful utterance
                         if self.stop_event.is_set():
                             try:
@@ -392,38 +523,17 @@ class VoiceEngine:
                 # Fallback to gTTS + pygame if available and online preference not set
                 if gTTS and pygame:
                     try:
-                        try:
-                            if not pygame.mixer.get_init():
-                                pygame.mixer.pre_init(44100, -16, 2, 2048)
-                                pygame.mixer.init()
-                        except Exception:
-                            pass
+                        self._ensure_mixer()
                         filename = None
                         try:
                             fd, filename = tempfile.mkstemp(prefix='voice_', suffix='.mp3')
                             os.close(fd)
                             tts = gTTS(text=text, lang='en', tld='co.uk')
                             tts.save(filename)
-                            try:
-                                pygame.mixer.music.load(filename)
-                                pygame.mixer.music.set_volume(float(self.tts_volume))
-                                pygame.mixer.music.play()
-                                while pygame.mixer.music.get_busy():
-                                    if self.stop_event.is_set():
-                                        try:
-                                            pygame.mixer.music.stop()
-                                        except Exception:
-                                            pass
-                                        break
-                                    time.sleep(0.1)
-                                try:
-                                    pygame.mixer.music.unload()
-                                except Exception:
-                                    pass
-                            except Exception as e:
-                                print('pygame playback error for gTTS fallback:', e)
+                            self._playback_queue.put((filename, True, generation))
+                            handed_off = True
                         finally:
-                            if filename and os.path.exists(filename):
+                            if filename and not handed_off and os.path.exists(filename):
                                 try:
                                     os.remove(filename)
                                 except Exception:
@@ -451,6 +561,100 @@ class VoiceEngine:
                     self.tts_queue.task_done()
                 except Exception:
                     pass
+                # Handed-off clips are accounted for by the playback thread.
+                if not handed_off:
+                    self._utterance_done()
+
+    def _play_file(self, filename: str) -> bool:
+        """Plays an audio file, preferring the system PulseAudio/PipeWire player.
+
+        Returns False when nothing could play it (no player, no mixer, or the
+        player failed), so callers can fall back to live synthesis.
+        """
+        paplay = _which('paplay') or _which('pw-play')
+        if paplay:
+            try:
+                # stop_speaking() terminates the player, which ends this wait
+                # straight away.
+                self._player_proc = proc = subprocess.Popen([paplay, filename])
+                returncode = proc.wait()
+                self._player_proc = None
+                # A player killed by stop_speaking() counts as handled; don't
+                # replay the clip through pygame.
+                if returncode == 0 or self.stop_event.is_set():
+                    return True
+                print(f'{os.path.basename(paplay)} exited with {returncode}, falling back to pygame')
+            except Exception as e:
+                self._player_proc = None
+                print('paplay/pw-play failed, falling back to pygame:', e)
+        if pygame and self._ensure_mixer():
+            try:
+                self._play_with_pygame(filename)
+                return True
+            except Exception as e:
+                print('pygame playback error:', e)
+        return False
+
+    def _speak_cached_pyttsx3(self, engine, text: str, cache_dir: str) -> bool:
+        """Speaks a fixed phrase from a rendered wav, rendering it on first use.
+
+        Returns False when the phrase couldn't be rendered or played so the
+        caller can fall back to live synthesis.
+        """
+        key = f"{text}|{self.preferred_voice}|{int(self.tts_rate)}|{float(self.tts_volume):.2f}"
+        path = os.path.join(cache_dir, f"pyttsx3-{hashlib.sha1(key.encode('utf-8')).hexdigest()}.wav")
+        if not os.path.exists(path):
+            tmp = path[:-4] + ".part.wav"  # some drivers pick the format from the suffix
+            try:
+                engine.save_to_file(text, tmp)
+                engine.runAndWait()
+                if os.path.getsize(tmp) <= 44:  # header only: nothing rendered
+                    raise OSError("empty render")
+                os.replace(tmp, path)
+            except Exception:
+                try:
+                    os.remove(tmp)
+                except Exception:
+                    pass
+                return False
+        return self._play_file(path)
+
+    def _play_with_pygame(self, filename: str):
+        """Plays an audio file through pygame.mixer.music until it ends or stop_speaking()."""
+        music = pygame.mixer.music
+        music.load(filename)
+        music.set_volume(float(self.tts_volume))
+        music.play()
+        # Waiting on stop_event (instead of sleeping) makes stop_speaking()
+        # take effect immediately rather than at the next 100 ms tick.
+        # set_endevent() would need pygame's display/event system, which this
+        # Tk app never starts, so this loop stays the only get_busy() poller;
+        # everyone else waits on audio_idle.
+        busy = music.get_busy
+        while busy():
+            if self.stop_event.wait(0.1):
+                try:
+                    music.stop()
+                except Exception:
+                    pass
+                break
+        try:
+            music.unload()
+        except Exception:
+            pass
+
+    def _ensure_mixer(self) -> bool:
+        """Initialise pygame.mixer once; later calls skip the get_init() probe."""
+        if self._mixer_ready:
+            return True
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.pre_init(44100, -16, 2, 2048)
+                pygame.mixer.init()
+            self._mixer_ready = True
+        except Exception as e:
+            print(f"Mixer Init Error: {e}")
+        return self._mixer_ready
 
     def listen(self):
         if not self.recognizer or not self.mic:
@@ -501,32 +705,203 @@ class VoiceEngine:
         Returns the keyphrase string if detected, otherwise None.
         """
         try:
-            import time
-            import subprocess
             cmd = [
                 "pocketsphinx", "kws",
-                "-keyphrase", "friday",
+                "-keyphrase", _WAKE_WORD,
                 "-threshold", "1e-20",
                 "-adcdev", "default",
                 "-logfn", "/dev/null",
             ]
             process = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-            time.sleep(0.1)
-            if "friday" in (process.stdout or "").lower():
-                return "friday"
+            if _WAKE_RE.search(process.stdout or ""):
+                return _WAKE_WORD
             return None
         except Exception:
             return None
 
+    def start_wake_word(self, on_wake) -> bool:
+        """Stream keyword spotting from one persistent pocketsphinx process.
+
+        on_wake() is called from a reader thread for every "friday" the
+        spotter reports. Without the pocketsphinx CLI, falls back to the
+        Python decoder; returns False when neither is available.
+        """
+        proc = self._kws_proc
+        if proc is not None and proc.poll() is None:
+            return True
+        exe = _which("pocketsphinx")
+        if not exe:
+            return self._start_wake_word_inprocess(on_wake)
+        try:
+            proc = subprocess.Popen(
+                [exe, "kws", "-keyphrase", _WAKE_WORD, "-threshold", "1e-20",
+                 "-adcdev", "default", "-logfn", os.devnull],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except Exception:
+            return False
+        self._kws_proc = proc
+        stop = self._kws_stop = threading.Event()
+        started = time.monotonic()
+
+        def reader():
+            try:
+                for line in proc.stdout:
+                    if _WAKE_RE.search(line):
+                        on_wake()
+            except Exception:
+                pass
+            # stop_wake_word() clears _kws_proc first; anything else means the
+            # spotter died (device busy, crash). Restart it, but give up after
+            # a few deaths in a row so a missing mic doesn't become a poll loop.
+            if self._kws_proc is not proc:
+                return
+            self._kws_proc = None
+            quick = time.monotonic() - started < 5.0
+            self._kws_failures = self._kws_failures + 1 if quick else 0
+            if self._kws_failures >= 3:
+                print("Wake word spotter keeps exiting; giving up until next hide.")
+                return
+            time.sleep(1.0)
+            if self._kws_proc is None and not stop.is_set():
+                self.start_wake_word(on_wake)
+
+        threading.Thread(target=reader, daemon=True).start()
+        return True
+
+    def _start_wake_word_inprocess(self, on_wake) -> bool:
+        """Keyword spotting on raw 16 kHz PCM from the microphone, on-device."""
+        if pocketsphinx is None or sr is None or not hasattr(pocketsphinx, "Decoder"):
+            return False
+        thread = self._kws_thread
+        if thread is not None and thread.is_alive():
+            return True
+        # Build the decoder and open the mic here rather than in the thread,
+        # so an unsupported pocketsphinx API or an unusable device makes this
+        # return False instead of leaving a dead spotter that looks alive.
+        try:
+            decoder = pocketsphinx.Decoder(
+                keyphrase=_WAKE_WORD, kws_threshold=1e-20, samprate=16000
+            )
+        except Exception as e:
+            print(f"Wake word decoder unavailable: {e}")
+            return False
+        # The VAD endpointer passes only speech (plus a short lead-in) to the
+        # decoder, so silence costs a 30 ms VAD check per frame. Older
+        # pocketsphinx builds lack it; the RMS gate below covers that case.
+        ep = None
+        try:
+            ep = pocketsphinx.Endpointer(vad_mode=pocketsphinx.Vad.LOOSE, sample_rate=16000)
+            chunk = ep.frame_bytes // 2
+            ep.in_speech  # the loop relies on it; older bindings lack it
+        except Exception:
+            ep = None
+            chunk = 1024
+        try:
+            mic = sr.Microphone(
+                device_index=self.mic_device_index, sample_rate=16000, chunk_size=chunk
+            )
+            source = mic.__enter__()
+            if getattr(source, "stream", None) is None:
+                mic.__exit__(None, None, None)
+                raise RuntimeError("audio stream failed to open")
+        except Exception as e:
+            print(f"Wake word microphone unavailable: {e}")
+            return False
+        stop = self._kws_stop = threading.Event()
+
+        def run():
+            try:
+                # Without the endpointer, a C-level RMS check stands in for
+                # the VAD: quiet frames are skipped, with a short pre-roll and
+                # hangover so words aren't clipped at either end.
+                energy = getattr(self.recognizer, "energy_threshold", 300)
+                preroll = collections.deque(maxlen=4)
+                hangover = 0
+                try:
+                    if ep is None:
+                        decoder.start_utt()
+                    while not stop.is_set():
+                        frame = source.stream.read(chunk)
+                        if ep is None:
+                            if audioop is not None:
+                                if audioop.rms(frame, 2) >= energy:
+                                    if hangover == 0:
+                                        for old in preroll:
+                                            decoder.process_raw(old, False, False)
+                                        preroll.clear()
+                                    hangover = 8
+                                elif hangover == 0:
+                                    preroll.append(frame)
+                                    continue
+                                else:
+                                    hangover -= 1
+                            decoder.process_raw(frame, False, False)
+                            if decoder.hyp() is not None:
+                                decoder.end_utt()
+                                on_wake()
+                                decoder.start_utt()
+                            continue
+                        was_in_speech = ep.in_speech
+                        speech = ep.process(frame)
+                        if speech is None:
+                            continue
+                        if not was_in_speech:
+                            decoder.start_utt()
+                        decoder.process_raw(speech, False, False)
+                        if decoder.hyp() is not None:
+                            decoder.end_utt()
+                            on_wake()
+                            decoder.start_utt()
+                        if not ep.in_speech:
+                            decoder.end_utt()
+                    if ep is None or ep.in_speech:
+                        decoder.end_utt()
+                finally:
+                    mic.__exit__(None, None, None)
+            except Exception as e:
+                print(f"Wake word listener error: {e}")
+
+        self._kws_thread = threading.Thread(target=run, daemon=True)
+        self._kws_thread.start()
+        return True
+
+    def stop_wake_word(self):
+        """Stops the streaming wake-word spotter, if running."""
+        self._kws_stop.set()
+        self._kws_failures = 0
+        proc, self._kws_proc = self._kws_proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.terminate()
+            proc.wait(timeout=1)
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
     def stop_speaking(self):
         """Immediately terminates TTS playback and clears pending queue."""
+        self._tts_generation += 1
         self.stop_event.set()
+        proc = self._player_proc
+        if proc is not None:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
         while not self.tts_queue.empty():
             try:
                 self.tts_queue.get_nowait()
                 self.tts_queue.task_done()
             except queue.Empty:
                 break
+            self._utterance_done()
 
     def set_voice_properties(self, rate: int = 150, volume: float = 0.9):
         self.tts_rate = int(rate)
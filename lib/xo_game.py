@@ -3,6 +3,8 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
+import threading
+import time
 from typing import Optional, Callable
 
 
@@ -64,7 +66,6 @@ class XOGame:
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         self._setup_ui()
-        import random
         greetings = [
             "Uhm, let's play Tic-Tac-Toe, bro. You're X, I'm O. You go first!",
             "Alright dude, Tic-Tac-Toe time! You're X, I'm O. Your move, man.",
@@ -175,7 +176,6 @@ class XOGame:
             self.game_over = True
             self.user_wins += 1
             self._update_score()
-            import random
             responses = [
                 "Uhm, congrats bro! You won!",
                 "Dude, nice! You got me!",
@@ -191,7 +191,6 @@ class XOGame:
             self.game_over = True
             self.draws += 1
             self._update_score()
-            import random
             responses = [
                 "Uhm, it's a draw, bro! Good game.",
                 "Dude, we tied! Good one, man.",
@@ -230,7 +229,6 @@ class XOGame:
                 self.game_over = True
                 self.friday_wins += 1
                 self._update_score()
-                import random
                 responses = [
                     "Uhm, I won, bro! Better luck next time, dude.",
                     "Dude, I got you this time!",
@@ -245,7 +243,6 @@ class XOGame:
                 self.game_over = True
                 self.draws += 1
                 self._update_score()
-                import random
                 responses = [
                     "Uhm, it's a draw, bro! Good game.",
                     "Dude, we tied! Good one, man.",
@@ -329,9 +326,7 @@ class XOGame:
         if is_question and self.command_processor:
             self.command_processor.conversation_mode = True
             # Auto-disable after 10 seconds
-            import threading
             def disable_conv_mode():
-                import time
                 time.sleep(10)
                 if self.command_processor:
                     self.command_processor.conversation_mode = False
@@ -371,7 +366,6 @@ class XOGame:
                 self.buttons[i][j].config(text='', state=tk.NORMAL)
         
         self.turn_label.config(text="Your turn (X)", fg='#00e676')
-        import random
         responses = [
             "Uhm, new game, bro! Your turn.",
             "Alright dude, new game! Go ahead, man.",
@@ -9,28 +9,36 @@ practical automations:
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import ctypes
 import datetime
+import difflib
+import errno
+import functools
+import hmac
+import importlib
+import importlib.util
+import itertools
 import json
 import secrets
 import os
+import random
+import re
 import shlex
 import shutil
+import stat
 import subprocess
 import sys
 import threading
 import time
+import tkinter as tk
 import webbrowser
 from dataclasses import dataclass
 from tkinter import filedialog, messagebox
+from types import MappingProxyType
 from io import BytesIO
 
-# Optional window-management imports for a Jarvis-style dashboard
-try:
-    import pygetwindow as gw
-except Exception:
-    gw = None
-
 # Suppress ALSA/JACK library warnings in the console (Linux)
 def py_error_handler(filename, line, function, err, fmt):
     pass
@@ -52,6 +60,20 @@ try:
 except Exception:
     pass
 
+# If you want to run without audio (CI/headless) set:
+#   FRIDAY_HEADLESS=1  or FRIDAY_DISABLE_AUDIO_WARNINGS=1
+# Native audio noise is silenced by the ALSA handler above; stderr itself is
+# left alone so tracebacks from worker threads stay visible.
+_FRIDAY_HEADLESS = (
+    os.environ.get("FRIDAY_HEADLESS") == "1"
+    or os.environ.get("FRIDAY_DISABLE_AUDIO_WARNINGS") == "1"
+)
+if _FRIDAY_HEADLESS:
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+# Must be set before lib.voice_engine imports pygame.
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
+
 try:
     import customtkinter as ctk
 except Exception:
@@ -63,6 +85,7 @@ except Exception as e:
     VoiceEngine = None  # type: ignore[assignment]
     _voice_engine_import_error = e
 
+_command_processor_import_error: Exception | None = None
 try:
     from lib.command_processor import CommandProcessor
 except Exception as e:
@@ -74,22 +97,12 @@ try:
 except Exception:
     GestureController = None  # type: ignore[assignment]
 
-# If you want to run without audio (CI/headless) set:
-#   FRIDAY_HEADLESS=1  or FRIDAY_DISABLE_AUDIO_WARNINGS=1
-_FRIDAY_HEADLESS = (
-    os.environ.get("FRIDAY_HEADLESS") == "1"
-    or os.environ.get("FRIDAY_DISABLE_AUDIO_WARNINGS") == "1"
-)
-if _FRIDAY_HEADLESS:
-    os.environ["SDL_AUDIODRIVER"] = "dummy"
-
-os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
-_stderr_null = None
-if _FRIDAY_HEADLESS:
-    _stderr_null = open(os.devnull, "w")
-    sys.stderr = _stderr_null
-
-import pygame
+try:
+    from lib.camera import open_camera
+except Exception:
+    # Only fails if the lib package itself can't import, in which case
+    # VoiceEngine is missing too and FridayGUI refuses to start.
+    open_camera = None  # type: ignore[assignment]
 
 try:
     import psutil  # type: ignore
@@ -101,17 +114,98 @@ try:
 except Exception:
     pyautogui = None
 
-try:
-    from PIL import Image  # type: ignore
-except Exception:
-    Image = None  # type: ignore[assignment]
 
-try:
-    from flask import Flask, Response, request  # type: ignore
-except Exception:
-    Flask = None  # type: ignore[assignment]
-    Response = None  # type: ignore[assignment]
-    request = None  # type: ignore[assignment]
+@functools.lru_cache(maxsize=None)
+def _lazy(name: str):
+    """Import module `name` on first use; None if it isn't available.
+
+    Keeps Pillow, Flask, OpenCV and MediaPipe off the startup path.
+    """
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except Exception:
+        return False
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_dir(path: str) -> bool:
+    # Windows isdir is a single GetFileAttributesW call, cheaper than os.stat.
+    if os.name == "nt":
+        return os.path.isdir(path)
+    st = _stat_or_none(path)
+    return st is not None and stat.S_ISDIR(st.st_mode)
+
+
+def _copy_tree_parallel(src: str, dest: str, workers: int = 8, copy_function=shutil.copy2) -> None:
+    """Copy a folder tree to another filesystem, overlapping file copies.
+
+    Directories are created up front so copy tasks never race on makedirs.
+    Raises on the first failed copy; the source is left untouched.
+    """
+    files: list[tuple[str, str]] = []
+    dirs: list[tuple[str, str]] = []
+
+    def scan(root: str, target: str) -> None:
+        os.makedirs(target, exist_ok=True)
+        dirs.append((root, target))
+        # DirEntry carries the d_type from readdir, so classifying entries
+        # needs no extra stat per file.
+        with os.scandir(root) as it:
+            for entry in it:
+                out = os.path.join(target, entry.name)
+                if entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), out)
+                elif entry.is_dir(follow_symlinks=False):
+                    scan(entry.path, out)
+                else:
+                    files.append((entry.path, out))
+
+    scan(src, dest)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(copy_function, s, d) for s, d in files]
+        for fut in concurrent.futures.as_completed(futures):
+            fut.result()
+
+    # Directory times last, after their contents stopped changing.
+    for root, target in reversed(dirs):
+        shutil.copystat(root, target)
+
+
+def _fast_rmtree(path: str) -> list[str]:
+    """Post-order delete of a folder tree in one scandir pass per directory.
+
+    Keeps going past entries that can't be removed and returns their paths,
+    so one locked file doesn't leave the rest of the tree behind.
+    """
+    failed: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    failed.extend(_fast_rmtree(entry.path))
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    failed.append(entry.path)
+        os.rmdir(path)
+    except OSError:
+        failed.append(path)
+    return failed
 
 
 @dataclass(frozen=True)
@@ -128,16 +222,147 @@ class FridayColors:
     warn: str = "#f39c12"
 
 
+# slots=True needs Python 3.10; older interpreters get a plain dataclass.
+_DC_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DC_SLOTS)
+class _VoiceForm:
+    """State for the voice-driven create/move folder popups."""
+
+    mode: str
+    step: str
+    name: str = ""
+    dest_dir: str = ""
+    src: str = ""
+    dst: str = ""
+    on_conflict: str = "Rename"
+    window: object = None
+    name_label: object = None
+    loc_label: object = None
+    src_label: object = None
+    dst_label: object = None
+
+
+# Static yt-dlp options per download mode; only outtmpl and hooks vary.
+_YDL_DEFAULT_OPTS = MappingProxyType({"noplaylist": True, "format": "bv*+ba/best"})
+_YDL_VIDEO_MP4_OPTS = MappingProxyType(
+    {"noplaylist": True, "format": "bv*+ba/best", "merge_output_format": "mp4"}
+)
+_YDL_AUDIO_OPTS = MappingProxyType(
+    {
+        "noplaylist": True,
+        "format": "bestaudio/best",
+        "postprocessors": (
+            MappingProxyType(
+                {
+                    "key": "FFmpegExtractAudio",
+                    "preferredcodec": "mp3",
+                    "preferredquality": "192",
+                }
+            ),
+        ),
+    }
+)
+_YDL_MODE_OPTS = {
+    "Audio (mp3)": _YDL_AUDIO_OPTS,
+    "Video (mp4)": _YDL_VIDEO_MP4_OPTS,
+    "Video (best)": _YDL_DEFAULT_OPTS,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_user_dirs() -> dict[str, str]:
+    """Well-known user folders, resolved once per process.
+
+    "default" is the first of Desktop/Downloads/Documents that exists,
+    else the home directory.
+    """
+    home = os.path.expanduser("~")
+    dirs = {
+        "home": home,
+        "desktop": os.path.join(home, "Desktop"),
+        "downloads": os.path.join(home, "Downloads"),
+        "documents": os.path.join(home, "Documents"),
+    }
+    dirs["default"] = next(
+        (dirs[k] for k in ("desktop", "downloads", "documents") if os.path.isdir(dirs[k])),
+        home,
+    )
+    return dirs
+
+
+# Spoken lead-ins stripped from a folder name ("call it reports" -> "reports").
+_NAME_PREFIX_RE = re.compile(r"^(?:name it|call it|folder name|the name is)\s*", re.I)
+_SLASH_TRANS = str.maketrans({"/": " ", "\\": " "})
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+_HELP_TEXT = (
+    "FRIDAY COMMAND GUIDE\n"
+    "====================\n\n"
+    "Voice commands depend on your local CommandProcessor.\n"
+    "Typed commands always work in the Console tab.\n\n"
+    "VOICE POPUPS (NO KEYBOARD):\n"
+    "  - Say: create a new folder\n"
+    "    - Then say the folder name\n"
+    "    - Then say: desktop / downloads / documents / home, or say: confirm\n"
+    "  - Say: move folder\n"
+    "    - Then say the source folder path\n"
+    "    - Then say the destination folder path (parent folder)\n"
+    "    - Then say: confirm\n"
+    "  - Say: cancel to stop\n\n"
+    "TYPED COMMANDS:\n"
+    "  download <url> [out_dir]\n"
+    "  move \"<src_folder>\" \"<dst_folder>\"\n\n"
+    "UI FEATURES:\n"
+    "  - YouTube tab: download video/audio (requires yt-dlp + ffmpeg for mp3)\n"
+    "  - Files tab: move a folder to another location\n\n"
+    "NOTES:\n"
+    "  - Only download content you own or have permission to download.\n"
+)
+
+_GREETINGS = (
+    "FRIDAY online and standing by.",
+    "All systems are up. How can I help?",
+    "Systems online. I'm ready.",
+)
+
+# Lines kept in the activity log widget; older ones are trimmed on flush.
+_LOG_MAX_LINES = 2000
+
+# `xdotool getwindowgeometry --shell` lines, e.g. "X=120".
+_GEOMETRY_RE = re.compile(r"^(X|Y|WIDTH|HEIGHT|SCREEN)=(\S+)", re.M)
+
+# Voice intents handled by the GUI itself, checked in priority order.
+_VOICE_INTENTS = (
+    ("hide", re.compile(r"hide|sleep")),
+    ("create_folder", re.compile(r"new folder|create.*folder|folder.*create")),
+    ("move_folder", re.compile(r"move.*folder|folder.*move|^move$")),
+)
+
+
 class _FallbackCommandProcessor:
     def __init__(self, voice_engine: object, import_error: Exception):
         self.voice_engine = voice_engine
         self.import_error = import_error
+        self.chatbot_mode = False
 
     def process(self, command: str) -> bool:
         return False
 
 
-def _get_local_ip() -> str:
+_local_ip_cache: tuple[float, str | None] = (0.0, None)
+
+
+def _get_local_ip(ttl: float = 30.0) -> str:
+    # The UDP-connect probe is cheap but not free; the address rarely
+    # changes within a session, so reuse it for `ttl` seconds.
+    global _local_ip_cache
+    ts, cached = _local_ip_cache
+    now = time.monotonic()
+    if cached is not None and now - ts < ttl:
+        return cached
     try:
         import socket
 
@@ -145,9 +370,10 @@ def _get_local_ip() -> str:
         s.connect(("8.8.8.8", 80))
         ip = s.getsockname()[0]
         s.close()
-        return ip
     except Exception:
         return "127.0.0.1"
+    _local_ip_cache = (now, ip)
+    return ip
 
 
 class FridayGUI:
@@ -176,25 +402,52 @@ class FridayGUI:
         self.root.protocol("WM_DELETE_WINDOW", self.on_app_close)
 
         self.is_listening = False
+        self._listen_stop = threading.Event()
         self.is_hidden = False
         self.wake_word_enabled = True
 
         self._window_handles: list[object] = []
+        # Resolved once; PATH lookups stat every directory on each call.
+        self._xdotool_path = shutil.which("xdotool")
+        self._wmctrl_path = shutil.which("wmctrl")
+        self._window_refresh_job = None
+        self._window_refresh_last = 0.0
+        self._window_titles: list[str] = []
+        self._window_stable_ticks = 0
+        self._status_shown: tuple[str, str] | None = None
         self._download_thread: threading.Thread | None = None
         self._move_thread: threading.Thread | None = None
-        self._voice_form: dict | None = None
+        self._isdir_cache: dict[str, float] = {}
+        self._voice_form: _VoiceForm | None = None
+        self._home = _resolve_user_dirs()["home"]
+        self._form_fonts: dict[tuple[int, str], object] = {}
+        self._text_windows: dict[str, object] = {}
         self._yt_queue: list[dict] = []
         self._yt_queue_lock = threading.Lock()
+        self._yt_rendered_lines: list[str] = []
+        self._ydl = None
+        self._ydl_key: tuple[str, str] | None = None
+        self._yt_pending_progress: tuple | None = None
+        self._yt_progress_scheduled = False
+        self._yt_last_progress = {"t": 0.0, "msg": "", "key": None}
         self._last_download_path: str | None = None
         self.limited_mode = False
         self.command_processor_error: str | None = None
         self._config_base_path = os.path.join(os.path.dirname(__file__), "config.json")
         self._config_user_path = os.path.join(os.path.dirname(__file__), "config.user.json")
         self._config = self._load_config()
-        self._pending_config_write = False
-        self._cmd_history: list[str] = []
+        self._config_write_job = None
+        self._applied_voice: tuple[int, float] | None = None
+        self._cmd_history: collections.deque[str] = collections.deque(maxlen=200)
+        self._log_buf: collections.deque[str] = collections.deque()
+        self._log_flush_scheduled = False
+        self._log_lock = threading.Lock()
+        # (epoch second, "HH:MM:SS") as one tuple so worker threads never see
+        # a half-updated pair.
+        self._log_ts: tuple[int, str] = (0, "")
         self._cmd_history_idx: int | None = None
         self._camera_preview_stop = threading.Event()
+        self._camera_preview_wake = threading.Event()
         self._camera_preview_thread: threading.Thread | None = None
         self._camera_preview_cap = None
         self._camera_preview_lock = threading.Lock()
@@ -220,14 +473,20 @@ class FridayGUI:
         except Exception:
             memory_store = None
 
-        if CommandProcessor is None:
+        # command_processor is always set to something with process() and
+        # chatbot_mode, so call sites never need to probe for it.
+        processor_error = _command_processor_import_error
+        if CommandProcessor is not None:
+            try:
+                self.command_processor = CommandProcessor(self.voice_engine, memory_store)
+            except Exception as e:
+                processor_error = e
+        if processor_error is not None:
             self.limited_mode = True
-            self.command_processor_error = str(_command_processor_import_error)
+            self.command_processor_error = str(processor_error)
             self.command_processor = _FallbackCommandProcessor(
-                self.voice_engine, _command_processor_import_error
+                self.voice_engine, processor_error
             )  # type: ignore[arg-type]
-        else:
-            self.command_processor = CommandProcessor(self.voice_engine, memory_store)
 
         self.gesture_controller = None
         self._gesture_status = ctk.StringVar(value="Gestures: not started")
@@ -236,15 +495,14 @@ class FridayGUI:
         self._build_ui()
         self.update_voice_settings()
 
-        try:
-            pygame.mixer.music.set_volume(1.0)
-        except Exception:
-            pass
-
-        threading.Thread(target=self.background_listener, daemon=True).start()
+        self.background_listener()
         self.root.after(400, self._startup_greeting)
 
     def on_app_close(self):
+        try:
+            self.voice_engine.stop_wake_word()
+        except Exception:
+            pass
         try:
             self.stop_share_server()
         except Exception:
@@ -311,14 +569,18 @@ class FridayGUI:
             node = node[key]
         node[path[-1]] = value
 
-    def _schedule_config_write(self):
-        if self._pending_config_write:
-            return
-        self._pending_config_write = True
-        self.root.after(900, self._write_config_now)
+    def _schedule_config_write(self, delay: int = 900):
+        # Debounce: each call pushes the write back, so a slider drag
+        # produces one write after the user lets go.
+        if self._config_write_job is not None:
+            try:
+                self.root.after_cancel(self._config_write_job)
+            except Exception:
+                pass
+        self._config_write_job = self.root.after(delay, self._write_config_now)
 
     def _write_config_now(self):
-        self._pending_config_write = False
+        self._config_write_job = None
         try:
             tmp = f"{self._config_user_path}.tmp"
             with open(tmp, "w", encoding="utf-8") as f:
@@ -331,14 +593,7 @@ class FridayGUI:
 
     def _startup_greeting(self):
         try:
-            import random
-
-            greetings = [
-                "FRIDAY online and standing by.",
-                "All systems are up. How can I help?",
-                "Systems online. I'm ready.",
-            ]
-            self.voice_engine.speak(random.choice(greetings))
+            self.voice_engine.speak(random.choice(_GREETINGS), cache=True)
         except Exception:
             pass
 
@@ -1075,13 +1330,9 @@ class FridayGUI:
         deps = []
         if GestureController is None:
             deps.append("GestureController import failed (check deps).")
-        try:
-            import cv2  # type: ignore
-        except Exception:
+        if not _module_available("cv2"):
             deps.append("OpenCV (cv2) missing.")
-        try:
-            import mediapipe  # type: ignore
-        except Exception:
+        if not _module_available("mediapipe"):
             deps.append("MediaPipe missing.")
         if deps:
             self._gesture_status.set("Gestures: unavailable — " + " ".join(deps))
@@ -1107,18 +1358,23 @@ class FridayGUI:
         self.camera_preview_label.pack(fill="both", expand=True, padx=12, pady=(0, 12))
         self._camera_preview_ui_tick()
 
-        try:
-            import mediapipe as mp  # type: ignore
+        self._gesture_model_status.set(f"Model: {self._gesture_model_path}")
+        threading.Thread(target=self._check_gesture_model, daemon=True).start()
 
-            if hasattr(mp, "solutions"):
-                self._gesture_model_status.set("Model: not needed (mp.solutions available).")
-            else:
-                ok = os.path.exists(self._gesture_model_path)
-                self._gesture_model_status.set(
-                    f"Model: {'OK' if ok else 'MISSING'} — {self._gesture_model_path}"
-                )
+    def _check_gesture_model(self):
+        # Importing MediaPipe takes a second or more; do it off the Tk thread.
+        mp = _lazy("mediapipe")
+        if mp is None:
+            return
+        if hasattr(mp, "solutions"):
+            msg = "Model: not needed (mp.solutions available)."
+        else:
+            ok = os.path.exists(self._gesture_model_path)
+            msg = f"Model: {'OK' if ok else 'MISSING'} — {self._gesture_model_path}"
+        try:
+            self.root.after(0, lambda: self._gesture_model_status.set(msg))
         except Exception:
-            self._gesture_model_status.set(f"Model: {self._gesture_model_path}")
+            pass
 
     def _refresh_system_tab(self):
         lines = []
@@ -1132,7 +1388,7 @@ class FridayGUI:
             try:
                 cpu = psutil.cpu_percent(interval=None)
                 mem = psutil.virtual_memory()
-                disk = psutil.disk_usage(os.path.expanduser("~"))
+                disk = psutil.disk_usage(self._home)
                 lines.append(f"CPU: {cpu:5.1f}%")
                 lines.append(
                     f"RAM: {mem.percent:5.1f}%  ({self._human_bytes(mem.used)} / {self._human_bytes(mem.total)})"
@@ -1144,7 +1400,7 @@ class FridayGUI:
                 lines.append(f"psutil error: {e}")
         else:
             try:
-                st = os.statvfs(os.path.expanduser("~"))
+                st = os.statvfs(self._home)
                 total = st.f_frsize * st.f_blocks
                 free = st.f_frsize * st.f_bavail
                 used = total - free
@@ -1211,6 +1467,22 @@ class FridayGUI:
             pass
         self.log(f"Gesture detected: {label}")
 
+    @staticmethod
+    def _gesture_label(fingers: int) -> str:
+        if fingers == 1:
+            return "1 finger (mouse)"
+        if fingers == 2:
+            return "2 fingers (tap=click / hold=camera)"
+        if fingers == 3:
+            return "3 fingers (listen)"
+        if fingers == 4:
+            return "4 fingers (move window)"
+        if fingers >= 5:
+            return "5 fingers (close window)"
+        if fingers == 0:
+            return "fist (stop)"
+        return f"{fingers} fingers"
+
     def _open_camera_tab(self):
         try:
             self.tabs.set("Camera")
@@ -1230,7 +1502,7 @@ class FridayGUI:
 
     def _on_window_move_toggle(self):
         if bool(self._window_move_enabled.get()):
-            if gw is None and not self._has_xdotool():
+            if _lazy("pygetwindow") is None and not self._has_xdotool():
                 self._window_move_enabled.set(False)
                 self.toast(
                     "Window move unavailable (need xdotool on Linux).",
@@ -1251,7 +1523,7 @@ class FridayGUI:
 
     def _on_screenshot_toggle(self):
         if bool(self._screenshot_enabled.get()):
-            if pyautogui is None and Image is None:
+            if pyautogui is None and _lazy("PIL.Image") is None:
                 self._screenshot_enabled.set(False)
                 self.toast("Screenshot unavailable (missing Pillow/pyautogui).", level="error", ms=4500)
                 return
@@ -1321,6 +1593,7 @@ class FridayGUI:
     def _window_drag_start(self, x: float, y: float):
         win = None
         xwid = None
+        gw = _lazy("pygetwindow")
         if gw is not None:
             try:
                 win = gw.getActiveWindow()
@@ -1391,6 +1664,7 @@ class FridayGUI:
         if not bool(self._close_window_enabled.get()):
             return
         try:
+            gw = _lazy("pygetwindow")
             if gw is not None:
                 try:
                     win = gw.getActiveWindow()
@@ -1614,25 +1888,17 @@ class FridayGUI:
             return None
 
     def _share_windows_list(self) -> list[str]:
-        titles = []
         try:
-            if self._has_xdotool():
-                ids = self._xdotool("search", "--onlyvisible", "--name", ".")
-                for wid in [l.strip() for l in ids.splitlines() if l.strip()][:40]:
-                    try:
-                        t = self._xdotool("getwindowname", wid).strip()
-                        if t:
-                            titles.append(t)
-                    except Exception:
-                        continue
+            return [title for _wid, title in self._xdotool_window_titles(limit=40)]
         except Exception:
-            pass
-        return titles
+            return []
 
     def start_share_server(self):
-        if Flask is None or Response is None or request is None:
+        flask = _lazy("flask")
+        if flask is None:
             self.toast("Flask not available; share server disabled.", level="error", ms=4500)
             return
+        Flask, Response, request = flask.Flask, flask.Response, flask.request
         if self.share_running:
             return
 
@@ -1646,9 +1912,14 @@ class FridayGUI:
         app = Flask("friday_share")
         self._share_app = app
 
+        token_b = token.encode("utf-8")
+
         def check_token(req) -> bool:
+            # Constant-time compare; /stream.mjpg checks once when the stream
+            # opens, not per frame.
             try:
-                return (req.args.get("token") or "") == token
+                given = (req.args.get("token") or "").encode("utf-8")
+                return hmac.compare_digest(given, token_b)
             except Exception:
                 return False
 
@@ -1774,7 +2045,7 @@ class FridayGUI:
             return
 
         idx = int(self.camera_index_var.get())
-        cap = cv2.VideoCapture(idx)
+        cap = open_camera(cv2, idx, 1280, 720)
         ok = bool(cap.isOpened())
         try:
             if ok:
@@ -1798,12 +2069,8 @@ class FridayGUI:
             self.toast("Gesture controller unavailable (missing deps).", level="error")
             return
         use_tasks = False
-        try:
-            import mediapipe as mp  # type: ignore
-
-            use_tasks = not hasattr(mp, "solutions")
-        except Exception:
-            use_tasks = False
+        mp = _lazy("mediapipe")
+        use_tasks = mp is not None and not hasattr(mp, "solutions")
 
         model_path = None
         if use_tasks:
@@ -1829,22 +2096,16 @@ class FridayGUI:
             self._gesture_set_status(msg)
             self.log(f"Gesture status: {msg}")
 
+        self._last_gesture_label = None
+
         def on_detection(fingers: int, pointer):
+            # Runs on the Tk thread already (the controller routes callbacks
+            # through `dispatch`); only touch the label when it changes.
             try:
-                if fingers == 1:
-                    self._set_last_gesture("1 finger (mouse)")
-                elif fingers == 2:
-                    self._set_last_gesture("2 fingers (tap=click / hold=camera)")
-                elif fingers == 3:
-                    self._set_last_gesture("3 fingers (listen)")
-                elif fingers == 4:
-                    self._set_last_gesture("4 fingers (move window)")
-                elif fingers >= 5:
-                    self._set_last_gesture("5 fingers (close window)")
-                elif fingers == 0:
-                    self._set_last_gesture("fist (stop)")
-                else:
-                    self._set_last_gesture(f"{fingers} fingers")
+                label = self._gesture_label(fingers)
+                if label != self._last_gesture_label:
+                    self._last_gesture_label = label
+                    self._set_last_gesture(label)
             except Exception:
                 pass
 
@@ -1872,7 +2133,7 @@ class FridayGUI:
                 on_two_fingers_hold=lambda: self.root.after(0, self._open_camera_tab),
                 on_two_fingers_tap=lambda: self.root.after(0, self._gesture_click),
                 on_open_palm=lambda: self.root.after(0, self._gesture_open_palm_action),
-                on_detection=lambda f, p: self.root.after(0, lambda: on_detection(f, p)),
+                on_detection=on_detection,
                 camera_index=idx,
                 start_immediately=True,
                 cooldown_s=1.2,
@@ -1906,6 +2167,7 @@ class FridayGUI:
         self._gesture_set_status("stopped")
 
     def start_camera_preview(self):
+        Image = _lazy("PIL.Image")
         if Image is None:
             self.toast("Pillow missing; camera preview unavailable.", level="error")
             return
@@ -1926,7 +2188,7 @@ class FridayGUI:
         self._camera_preview_stop.clear()
 
         def worker():
-            cap = cv2.VideoCapture(idx)
+            cap = open_camera(cv2, idx, 1280, 720)
             if not cap.isOpened():
                 self.root.after(0, lambda: self.toast(f"Camera {idx} failed to open.", level="error"))
                 return
@@ -1942,7 +2204,9 @@ class FridayGUI:
                     img = img.resize((960, 540))
                     with self._camera_preview_lock:
                         self._camera_preview_pil = img
-                    time.sleep(0.02)
+                    # Wait for the UI tick to consume the frame (or time out).
+                    self._camera_preview_wake.wait(timeout=1.0 / 30)
+                    self._camera_preview_wake.clear()
             finally:
                 try:
                     cap.release()
@@ -1961,6 +2225,7 @@ class FridayGUI:
 
     def stop_camera_preview(self):
         self._camera_preview_stop.set()
+        self._camera_preview_wake.set()
         try:
             if self._camera_preview_thread and self._camera_preview_thread.is_alive():
                 self._camera_preview_thread.join(timeout=1.0)
@@ -1990,6 +2255,7 @@ class FridayGUI:
                     light_image=img, dark_image=img, size=(960, 540)
                 )
                 self.camera_preview_label.configure(image=self._camera_preview_ctk_img, text="")
+                self._camera_preview_wake.set()
         except Exception:
             pass
         self.root.after(60, self._camera_preview_ui_tick)
@@ -2049,7 +2315,7 @@ class FridayGUI:
         cfg_out = self._get_config(
             "customization",
             "youtube_download_dir",
-            default=os.path.join(os.path.expanduser("~"), "Downloads"),
+            default=_resolve_user_dirs()["downloads"],
         )
         self.yt_out_dir = ctk.StringVar(value=str(cfg_out))
         self.yt_mode = ctk.StringVar(value="Video (best)")
@@ -2208,7 +2474,10 @@ class FridayGUI:
                 active = getattr(self, "_yt_active", None)
             lines = []
             if active:
-                lines.append(f"ACTIVE: {active.get('url')}")
+                urls = active.get("urls") or [active.get("url")]
+                lines.append(f"ACTIVE: {urls[0]}")
+                for extra in urls[1:]:
+                    lines.append(f"        {extra}")
                 lines.append(f"  Mode: {active.get('mode')} | Out: {active.get('out_dir')}")
                 lines.append("")
             if items:
@@ -2218,10 +2487,26 @@ class FridayGUI:
             else:
                 lines.append("Queue is empty.")
 
+            # Only rewrite lines after the longest unchanged prefix.
+            prev = self._yt_rendered_lines
+            k = 0
+            limit = min(len(prev), len(lines))
+            while k < limit and prev[k] == lines[k]:
+                k += 1
+            if k == len(prev) == len(lines):
+                return
+
             box.configure(state="normal")
-            box.delete("1.0", "end")
-            box.insert("end", "\n".join(lines) + "\n")
+            # Stop at end-1c: a delete that runs to "end" from a line start
+            # also takes the newline before it (Tk keeps its final newline),
+            # which would glue the first new line onto line k.
+            box.delete(f"{k + 1}.0", "end-1c")
+            # When the new lines are a strict prefix of the old ones there is
+            # nothing to append; inserting "\n" would leave a blank line.
+            if len(lines) > k:
+                box.insert("end", "\n".join(lines[k:]) + "\n")
             box.configure(state="disabled")
+            self._yt_rendered_lines = lines
         except Exception:
             pass
 
@@ -2246,9 +2531,30 @@ class FridayGUI:
                     self.root.after(0, self._yt_queue_render)
                     break
                 item = self._yt_queue.pop(0)
-                self._yt_active = item
+                # Batch up to 4 queued items sharing the same options into a
+                # single download() call so yt-dlp reuses its extractor state.
+                batch = [item]
+                rest = []
+                for other in self._yt_queue:
+                    if (
+                        len(batch) < 4
+                        and other["out_dir"] == item["out_dir"]
+                        and other["mode"] == item["mode"]
+                    ):
+                        batch.append(other)
+                    else:
+                        rest.append(other)
+                self._yt_queue[:] = rest
+                self._yt_active = {
+                    "url": item["url"],
+                    "urls": [it["url"] for it in batch],
+                    "out_dir": item["out_dir"],
+                    "mode": item["mode"],
+                }
             self.root.after(0, self._yt_queue_render)
-            self._download_youtube_once(item["url"], item["out_dir"], item["mode"])
+            self._download_youtube_once(
+                [it["url"] for it in batch], item["out_dir"], item["mode"]
+            )
 
     def _build_files_tab(self, parent):
         top = ctk.CTkFrame(parent, fg_color="transparent")
@@ -2264,6 +2570,7 @@ class FridayGUI:
         self.move_src = ctk.StringVar(value="")
         self.move_dst = ctk.StringVar(value="")
         self.move_on_conflict = ctk.StringVar(value="Rename")
+        self.move_preserve_meta = ctk.BooleanVar(value=False)
 
         form = ctk.CTkFrame(parent, fg_color="transparent")
         form.pack(fill="x", padx=12, pady=(4, 6))
@@ -2345,6 +2652,17 @@ class FridayGUI:
         )
         conflict.grid(row=2, column=1, sticky="w", padx=(10, 0), pady=(0, 6))
 
+        # Only matters across filesystems; same-volume moves are a rename.
+        ctk.CTkSwitch(
+            form,
+            text="Preserve timestamps/xattrs",
+            variable=self.move_preserve_meta,
+            fg_color="#1b2735",
+            progress_color=self.colors.accent,
+            text_color=self.colors.text,
+            font=ctk.CTkFont(family="Consolas", size=11, weight="bold"),
+        ).grid(row=3, column=1, sticky="w", padx=(10, 0), pady=(0, 6))
+
         form.grid_columnconfigure(1, weight=1)
 
         actions = ctk.CTkFrame(parent, fg_color="transparent")
@@ -2380,15 +2698,13 @@ class FridayGUI:
         )
         self.window_listbox.pack(fill="both", expand=True, padx=12, pady=(0, 12))
         self.window_listbox.bind("<Double-Button-1>", self.on_window_activate)
+        self.window_listbox.bind("<Visibility>", self._on_window_list_exposed)
+        self.window_listbox.bind("<FocusIn>", self._on_window_list_exposed)
 
     def _tk_canvas(self, parent, **kwargs):
-        import tkinter as tk
-
         return tk.Canvas(parent, highlightthickness=0, bd=0, **kwargs)
 
     def _tk_listbox(self, parent, **kwargs):
-        import tkinter as tk
-
         return tk.Listbox(parent, activestyle="none", **kwargs)
 
     def _init_orb_visual(self):
@@ -2411,55 +2727,85 @@ class FridayGUI:
         self._orb_pulse = c.create_oval(
             cx - 6, cy - 6, cx + 6, cy + 6, fill=self.colors.text, outline=""
         )
-        self._orb_pulse_dir = 1
+        # Precomputed triangle wave of pulse radii (4px -> 10px -> 4px).
+        min_radius, max_radius, step = 4.0, 10.0, 0.8
+        up = []
+        r = min_radius
+        while r < max_radius:
+            up.append(r)
+            r += step
+        up.append(max_radius)
+        # Whole bounding boxes, so a frame is one coords() call with no math.
+        # Canvas ovals snap to whole pixels anyway; ints keep the Tcl
+        # argument strings short.
+        self._orb_frames = itertools.cycle(
+            tuple(
+                (round(cx - r), round(cy - r), round(cx + r), round(cy + r))
+                for r in up + up[-2:0:-1]
+            )
+        )
         self._animate_orb_pulse()
 
     def _animate_orb_pulse(self):
-        c = self.orb_canvas
+        # Nothing to draw while withdrawn; just check back less often.
+        if self.is_hidden:
+            self.root.after(500, self._animate_orb_pulse)
+            return
         try:
-            x0, y0, x1, y1 = c.coords(self._orb_pulse)
+            self.orb_canvas.coords(self._orb_pulse, *next(self._orb_frames))
         except Exception:
             return
-
-        delta = 0.8 * self._orb_pulse_dir
-        x0 -= delta
-        y0 -= delta
-        x1 += delta
-        y1 += delta
-
-        max_radius = 10
-        min_radius = 4
-        cx = (x0 + x1) / 2
-        cy = (y0 + y1) / 2
-        r = (x1 - x0) / 2
-        if r > max_radius:
-            r = max_radius
-            self._orb_pulse_dir = -1
-        elif r < min_radius:
-            r = min_radius
-            self._orb_pulse_dir = 1
-
-        c.coords(self._orb_pulse, cx - r, cy - r, cx + r, cy + r)
         self.root.after(90, self._animate_orb_pulse)
 
     # ---------------------------
     # Logging / status
     # ---------------------------
     def log(self, message: str):
-        ts = datetime.datetime.now().strftime("%H:%M:%S")
-        line = f"[{ts}] {message}\n"
+        now = int(time.time())
+        sec, ts = self._log_ts
+        if now != sec:
+            ts = time.strftime("%H:%M:%S", time.localtime(now))
+            self._log_ts = (now, ts)
+        self._log_buf.append(f"[{ts}] {message}\n")
+        # Safe from any thread: the lock makes "is a flush pending?" and
+        # "schedule one" a single step, so a burst from several workers
+        # still queues exactly one Tk callback.
+        with self._log_lock:
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        self.root.after(100, self._flush_log)
+
+    def _flush_log(self):
+        # Coalesce bursts of log lines into a single Text insert + scroll.
+        # The flag is cleared before draining, so a line appended meanwhile
+        # is either drained here or schedules the next flush.
+        with self._log_lock:
+            self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        # popleft only what is there now: worker threads may append mid-drain,
+        # and a join()+clear() pair would drop those lines.
+        buf = self._log_buf
+        text = "".join([buf.popleft() for _ in range(len(buf))])
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", line)
+        self.log_text.insert("end", text)
+        # Keep the widget bounded so progress spam doesn't slow every redraw.
+        lines = int(self.log_text.index("end-1c").split(".")[0])
+        if lines > _LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{lines - _LOG_MAX_LINES + 1}.0")
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
     def clear_log(self):
+        self._log_buf.clear()
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
         self.log("Log cleared")
 
     def export_log(self):
+        self._flush_log()
         try:
             self.log_text.configure(state="normal")
             content = self.log_text.get("1.0", "end").strip()
@@ -2476,60 +2822,119 @@ class FridayGUI:
         ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
         path = os.path.join(logs_dir, f"friday-{ts}.log")
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
-                f.write("\n")
+            # One encode + binary write; skips text-mode newline translation.
+            with open(path, "wb") as f:
+                f.write(content.encode("utf-8", "replace") + b"\n")
             self.toast(f"Log exported: {path}", level="ok", ms=4500)
         except Exception as e:
             messagebox.showerror("Export failed", str(e))
 
     def update_status(self, status: str, color: str | None = None):
-        self.status_label.configure(text=status, text_color=(color or self.colors.ok))
-        self.root.update_idletasks()
+        color = color or self.colors.ok
+        # Tk is single-threaded: hop over if a worker calls this directly.
+        if threading.current_thread() is not threading.main_thread():
+            self.root.after(0, self.update_status, status, color)
+            return
+        # No forced update: the mainloop redraws on its next idle pass, and
+        # repeating the current status doesn't touch the label at all.
+        if (status, color) == self._status_shown:
+            return
+        self._status_shown = (status, color)
+        self.status_label.configure(text=status, text_color=color)
 
     # ---------------------------
     # Active windows
     # ---------------------------
     def refresh_window_list(self):
-        self._window_handles = []
-        self.window_listbox.delete(0, "end")
+        if self._window_refresh_job is not None:
+            try:
+                self.root.after_cancel(self._window_refresh_job)
+            except Exception:
+                pass
+            self._window_refresh_job = None
+
+        try:
+            visible = not self.is_hidden and bool(self.window_listbox.winfo_viewable())
+        except Exception:
+            visible = False
+
+        # Only poll while the panel is on screen; <Visibility>/<FocusIn>
+        # trigger an immediate refresh when it comes back.
+        if visible:
+            if self._populate_window_list():
+                self._window_stable_ticks = 0
+            else:
+                self._window_stable_ticks += 1
+            self._window_refresh_last = time.monotonic()
+            # A desktop that hasn't changed for a few ticks is polled half as
+            # often; the first change (or an expose event) speeds it back up.
+            delay = 8000 if self._window_stable_ticks >= 3 else 4000
+            self._window_refresh_job = self.root.after(delay, self.refresh_window_list)
+        else:
+            self._window_refresh_job = self.root.after(30000, self.refresh_window_list)
+
+    def _on_window_list_exposed(self, _event=None):
+        if time.monotonic() - self._window_refresh_last >= 1.0:
+            self.refresh_window_list()
+
+    def _populate_window_list(self) -> bool:
+        """Refresh the list; returns True when the visible titles changed."""
+        handles: list[object] = []
+        titles: list[str] = []
 
-        # Backend 1: pygetwindow (not supported on Linux in many versions)
+        # Backend 1: pygetwindow (not supported on Linux in many versions);
+        # imported on first refresh rather than at startup.
+        gw = _lazy("pygetwindow")
         if gw:
             try:
                 windows = gw.getAllWindows()
             except Exception:
                 windows = []
 
-            for w in windows:
-                try:
+            # One try around the whole scan; only if some window's properties
+            # raise (it closed mid-scan) redo it guarding each window.
+            try:
+                for w in windows:
                     title = (w.title or "").strip()
-                    if not title or not w.isVisible:
-                        continue
-                    self._window_handles.append(w)
-                    self.window_listbox.insert("end", title)
-                except Exception:
-                    continue
-        else:
-            # Backend 2 (Linux/X11): xdotool
-            if self._has_xdotool():
-                try:
-                    ids = self._xdotool("search", "--onlyvisible", "--name", ".")
-                    win_ids = [line.strip() for line in ids.splitlines() if line.strip()]
-                except Exception:
-                    win_ids = []
-
-                for wid in win_ids[:80]:
+                    if title and w.isVisible:
+                        handles.append(w)
+                        titles.append(title)
+            except Exception:
+                handles.clear()
+                titles.clear()
+                for w in windows:
                     try:
-                        title = self._xdotool("getwindowname", wid).strip()
-                        if not title:
-                            continue
-                        self._window_handles.append(("xdotool", wid))
-                        self.window_listbox.insert("end", title)
+                        title = (w.title or "").strip()
+                        if title and w.isVisible:
+                            handles.append(w)
+                            titles.append(title)
                     except Exception:
                         continue
-
-        self.root.after(4000, self.refresh_window_list)
+        else:
+            # Backend 2 (Linux/X11): xdotool
+            for wid, title in self._xdotool_window_titles(limit=80):
+                handles.append(("xdotool", wid))
+                titles.append(title)
+
+        # Handles may be new objects even when nothing visible changed; only
+        # touch the Listbox when titles differ, and then only the rows that
+        # did (so opening one window doesn't redraw or deselect the rest).
+        self._window_handles = handles
+        old = self._window_titles
+        if titles == old:
+            return False
+        self._window_titles = titles
+        lb = self.window_listbox
+        # Applied bottom-up so earlier opcodes' indices stay valid.
+        opcodes = difflib.SequenceMatcher(None, old, titles, autojunk=False).get_opcodes()
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                continue
+            if i2 > i1:
+                lb.delete(i1, i2 - 1)
+            if j2 > j1:
+                lb.insert(i1, *titles[j1:j2])
+        return True
 
     def on_window_activate(self, event=None):
         if not self._window_handles:
@@ -2554,11 +2959,89 @@ class FridayGUI:
             pass
 
     def _has_xdotool(self) -> bool:
-        return shutil.which("xdotool") is not None
+        return self._xdotool_path is not None
 
     def _xdotool(self, *args: str) -> str:
-        out = subprocess.check_output(["xdotool", *args], text=True, stderr=subprocess.DEVNULL)
-        return (out or "").strip()
+        # Read bytes and decode once; text=True sets up a locale-aware
+        # TextIOWrapper for every tiny result.
+        out = subprocess.check_output([self._xdotool_path, *args], stderr=subprocess.DEVNULL)
+        return out.decode("utf-8", "replace").strip()
+
+    def _xdotool_window_titles(self, limit: int = 80) -> list[tuple[str, str]]:
+        """Return (window id, title) pairs for visible windows.
+
+        Titles come from a single `wmctrl -l` call when available, else from
+        one chained xdotool call, instead of one process per window.
+        """
+        if not self._has_xdotool():
+            return []
+        try:
+            ids = self._xdotool("search", "--onlyvisible", "--name", ".")
+            win_ids = [line.strip() for line in ids.splitlines() if line.strip()]
+        except Exception:
+            return []
+        win_ids = win_ids[:limit]
+
+        if self._wmctrl_path is not None:
+            try:
+                out = subprocess.run(
+                    [self._wmctrl_path, "-l"], capture_output=True, text=True, check=True
+                ).stdout
+                # Each line: "<hex id> <desktop> <host> <title>"
+                by_id = {}
+                for line in out.splitlines():
+                    parts = line.split(None, 3)
+                    if len(parts) == 4:
+                        by_id[int(parts[0], 16)] = parts[3].strip()
+                pairs = []
+                for wid in win_ids:
+                    try:
+                        title = by_id.get(int(wid))
+                    except ValueError:
+                        continue
+                    if title:
+                        pairs.append((wid, title))
+                return pairs
+            except Exception:
+                pass
+
+        titles = self._xdotool_batch_window_names(win_ids)
+        if titles is not None:
+            return [(wid, title) for wid, title in zip(win_ids, titles) if title]
+
+        pairs = []
+        for wid in win_ids:
+            try:
+                title = self._xdotool("getwindowname", wid).strip()
+            except Exception:
+                continue
+            if title:
+                pairs.append((wid, title))
+        return pairs
+
+    def _xdotool_batch_window_names(self, win_ids: list[str]) -> list[str] | None:
+        """Fetch all titles with one chained xdotool call.
+
+        Returns None if the call fails or the output can't be matched back to
+        the ids one line per window (e.g. a window vanished mid-call).
+        """
+        if not win_ids:
+            return []
+        argv = [self._xdotool_path]
+        for wid in win_ids:
+            argv += ["getwindowname", wid]
+        try:
+            out = subprocess.check_output(argv, stderr=subprocess.DEVNULL).decode(
+                "utf-8", "replace"
+            )
+        except Exception:
+            return None
+        lines = out.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+        if len(lines) != len(win_ids):
+            return None
+        return [line.strip() for line in lines]
 
     def _xdotool_active_window_id(self) -> str | None:
         if not self._has_xdotool():
@@ -2572,11 +3055,7 @@ class FridayGUI:
     def _xdotool_window_geometry(self, wid: str) -> dict | None:
         try:
             out = self._xdotool("getwindowgeometry", "--shell", wid)
-            data = {}
-            for line in out.splitlines():
-                if "=" in line:
-                    k, v = line.split("=", 1)
-                    data[k.strip()] = v.strip()
+            data = dict(_GEOMETRY_RE.findall(out))
             # Expect X,Y,WIDTH,HEIGHT
             if "X" in data and "Y" in data:
                 return data
@@ -2603,6 +3082,9 @@ class FridayGUI:
         try:
             speed = int(self.speed_var.get())
             volume = float(self.volume_var.get())
+            if self._applied_voice == (speed, volume):
+                return
+            self._applied_voice = (speed, volume)
             self.voice_engine.set_voice_properties(rate=speed, volume=volume)
             self.log(f"Voice updated: speed={speed}, volume={volume:.2f}")
             self._set_config("assistant", "voice_speed", value=speed)
@@ -2626,26 +3108,31 @@ class FridayGUI:
         self.update_status("Listening…", self.colors.warn)
         self.log("Voice listening started")
 
-        threading.Thread(target=self.listen_loop, daemon=True).start()
+        # One Event per session: a quick stop/start can't leave the old
+        # thread running next to the new one.
+        self._listen_stop = threading.Event()
+        threading.Thread(target=self.listen_loop, args=(self._listen_stop,), daemon=True).start()
 
     def stop_listening(self):
         self.is_listening = False
+        self._listen_stop.set()
         self.listen_button.configure(state="normal")
         self.stop_button.configure(state="disabled")
         self.update_status("Stopped", self.colors.danger)
         self.log("Voice listening stopped")
 
-    def listen_loop(self):
-        while self.is_listening:
+    def listen_loop(self, stop: threading.Event):
+        audio_idle = getattr(self.voice_engine, "audio_idle", None)
+        while not stop.is_set():
             try:
-                try:
-                    if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
-                        time.sleep(0.2)
-                        continue
-                except Exception:
-                    pass
+                # Block (without polling) while FRIDAY is speaking so the mic
+                # doesn't pick up her own voice.
+                if audio_idle is not None and not audio_idle.is_set():
+                    audio_idle.wait(timeout=1.0)
+                    continue
 
                 text = None
+                started = time.monotonic()
                 try:
                     if hasattr(self.voice_engine, "listen_for_command"):
                         text = self.voice_engine.listen_for_command()
@@ -2657,12 +3144,12 @@ class FridayGUI:
                 if text:
                     text = text.strip()
                     self.root.after(0, lambda t=text: self._handle_recognized_text(t))
-
-                time.sleep(0.1)
+                elif time.monotonic() - started < 0.05:
+                    # Nothing was even captured (no mic, stream failed to
+                    # open, device busy): back off instead of spinning.
+                    stop.wait(0.5)
             except Exception:
-                time.sleep(0.5)
-
-        self.root.after(0, self.stop_listening)
+                stop.wait(0.5)
 
     def _handle_recognized_text(self, text: str):
         text = (text or "").strip()
@@ -2676,14 +3163,14 @@ class FridayGUI:
             return
 
         lowered = text.lower()
-        if any(w in lowered for w in ("hide", "sleep", "go to sleep")):
+        intent = next((name for name, rx in _VOICE_INTENTS if rx.search(lowered)), None)
+        if intent == "hide":
             self.hide_interface()
             return
-        if ("create" in lowered and "folder" in lowered) or "new folder" in lowered:
+        if intent == "create_folder":
             self._voice_form_start_create_folder()
             return
-
-        if ("move" in lowered and "folder" in lowered) or lowered.strip() == "move":
+        if intent == "move_folder":
             self._voice_form_start_move_folder()
             return
 
@@ -2697,26 +3184,31 @@ class FridayGUI:
             self._fallback_handle_command(text)
 
     def background_listener(self):
-        while True:
-            try:
-                if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
-                    time.sleep(1)
-                    continue
+        # The wake-word spotter is a streaming process that only runs while the
+        # window is hidden; call this whenever hidden/enabled state changes.
+        try:
+            if self.wake_word_enabled and self.is_hidden:
+                if hasattr(self.voice_engine, "start_wake_word"):
+                    self.voice_engine.start_wake_word(self._on_wake_word)
+            elif hasattr(self.voice_engine, "stop_wake_word"):
+                self.voice_engine.stop_wake_word()
+        except Exception:
+            pass
 
-                if (
-                    self.wake_word_enabled
-                    and self.is_hidden
-                    and hasattr(self.voice_engine, "listen_offline")
-                ):
-                    result = self.voice_engine.listen_offline(timeout=2)
-                    if (result or "").strip().lower() == "friday":
-                        self.root.after(0, self.show_interface)
-            except Exception:
-                pass
-            time.sleep(0.4)
+    def _on_wake_word(self):
+        # Runs on the spotter's reader thread; ignore our own TTS output.
+        audio_idle = getattr(self.voice_engine, "audio_idle", None)
+        if audio_idle is not None and not audio_idle.is_set():
+            return
+        self.root.after(0, self._wake_from_background)
+
+    def _wake_from_background(self):
+        if self.is_hidden:
+            self.show_interface()
 
     def show_interface(self):
         self.is_hidden = False
+        self.background_listener()
         try:
             self.root.deiconify()
             self.root.attributes("-topmost", True)
@@ -2724,13 +3216,14 @@ class FridayGUI:
         except Exception:
             pass
         try:
-            self.voice_engine.speak("I'm here. What can I do for you?")
+            self.voice_engine.speak("I'm here. What can I do for you?", cache=True)
         except Exception:
             pass
         self.start_listening()
 
     def hide_interface(self):
         self.is_hidden = True
+        self.background_listener()
         try:
             self.stop_listening()
         except Exception:
@@ -2740,7 +3233,7 @@ class FridayGUI:
         except Exception:
             pass
         try:
-            self.voice_engine.speak("Standing by.")
+            self.voice_engine.speak("Standing by.", cache=True)
         except Exception:
             pass
 
@@ -2748,14 +3241,14 @@ class FridayGUI:
         try:
             self.wake_word_enabled = bool(self._wake_var.get())
             self.log(f"Wake word: {'ON' if self.wake_word_enabled else 'OFF'}")
+            self.background_listener()
         except Exception:
             pass
 
     def toggle_chatbot(self):
         try:
             enabled = bool(self._chatbot_var.get())
-            if hasattr(self.command_processor, "chatbot_mode"):
-                self.command_processor.chatbot_mode = enabled
+            self.command_processor.chatbot_mode = enabled
             self.log(f"Chatbot mode: {'ON' if enabled else 'OFF'}")
         except Exception:
             pass
@@ -2767,7 +3260,7 @@ class FridayGUI:
         if not self._voice_form:
             return
         try:
-            win = self._voice_form.get("window")
+            win = self._voice_form.window
             if win and win.winfo_exists():
                 win.destroy()
         except Exception:
@@ -2776,62 +3269,70 @@ class FridayGUI:
         self.update_status("Ready", self.colors.ok)
 
     def _default_user_location(self) -> str:
-        home = os.path.expanduser("~")
-        for candidate in ("Desktop", "Downloads", "Documents"):
-            p = os.path.join(home, candidate)
-            if os.path.isdir(p):
-                return p
-        return home
+        return _resolve_user_dirs()["default"]
 
     def _extract_folder_name(self, text: str) -> str:
-        t = (text or "").strip()
-        for prefix in ("name it", "call it", "folder name", "the name is"):
-            if t.lower().startswith(prefix):
-                t = t[len(prefix) :].strip()
-                break
-        t = t.strip("\"' ").strip()
-        t = t.replace("/", " ").replace("\\", " ").strip()
-        return t
+        t = _NAME_PREFIX_RE.sub("", (text or "").strip(), count=1)
+        return t.strip("\"' ").translate(_SLASH_TRANS).strip()
 
     def _location_from_speech(self, text: str) -> str | None:
         t = (text or "").lower()
-        home = os.path.expanduser("~")
-        if "desktop" in t:
-            return os.path.join(home, "Desktop")
-        if "downloads" in t:
-            return os.path.join(home, "Downloads")
-        if "documents" in t:
-            return os.path.join(home, "Documents")
-        if "home" in t:
-            return home
+        dirs = _resolve_user_dirs()
+        for key in ("desktop", "downloads", "documents", "home"):
+            if key in t:
+                return dirs[key]
         if t.startswith("/") or (":" in t and "\\" in t):
             return text.strip()
         if "path " in t:
             return text.split(" ", 1)[1].strip() if " " in text else None
         return None
 
+    def _expand_home(self, path: str) -> str:
+        # Only "~" / "~/..." can expand; everything else is returned as-is.
+        if path == "~" or path.startswith(("~/", "~\\")):
+            return self._home + path[1:]
+        return os.path.expanduser(path) if path.startswith("~") else path
+
     def _unique_path(self, path: str) -> str:
         if not os.path.exists(path):
             return path
         base = path
-        n = 1
-        while True:
-            candidate = f"{base} ({n})"
-            if not os.path.exists(candidate):
-                return candidate
-            n += 1
+
+        def taken(n: int) -> bool:
+            return os.path.exists(f"{base} ({n})")
+
+        # Gallop (1, 2, 4, ...) to a free suffix, then bisect back to the
+        # boundary: O(log n) stats instead of one per existing copy.
+        if not taken(1):
+            return f"{base} (1)"
+        lo, hi = 1, 2
+        while taken(hi):
+            lo, hi = hi, hi * 2
+        # Invariant: lo is taken, hi is free.
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if taken(mid):
+                lo = mid
+            else:
+                hi = mid
+        return f"{base} ({hi})"
+
+    def _form_font(self, size: int, weight: str = "normal"):
+        # Voice popups are opened repeatedly; reuse one CTkFont per style
+        # instead of creating new Tk named fonts on every open.
+        key = (size, weight)
+        font = self._form_fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(family="Consolas", size=size, weight=weight)
+            self._form_fonts[key] = font
+        return font
 
     def _voice_form_start_create_folder(self):
         if self._voice_form:
             return
 
         dest_dir = self._default_user_location()
-        self._voice_form = {
-            "mode": "create_folder",
-            "step": "name",
-            "name": "",
-            "dest_dir": dest_dir,
-        }
+        self._voice_form = _VoiceForm(mode="create_folder", step="name", dest_dir=dest_dir)
 
         win = ctk.CTkToplevel(self.root)
         win.title("Create Folder (Voice)")
@@ -2844,7 +3345,7 @@ class FridayGUI:
             win,
             text="CREATE NEW FOLDER",
             text_color=self.colors.accent,
-            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            font=self._form_font(14, "bold"),
         )
         title.pack(anchor="w", padx=16, pady=(16, 8))
 
@@ -2855,7 +3356,7 @@ class FridayGUI:
             body,
             text="Name: (waiting…) ",
             text_color=self.colors.text,
-            font=ctk.CTkFont(family="Consolas", size=12, weight="bold"),
+            font=self._form_font(12, "bold"),
         )
         name_label.pack(anchor="w", padx=14, pady=(14, 6))
 
@@ -2863,7 +3364,7 @@ class FridayGUI:
             body,
             text=f"Location: {dest_dir}",
             text_color=self.colors.muted,
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=self._form_font(11),
             wraplength=520,
             justify="left",
         )
@@ -2873,15 +3374,15 @@ class FridayGUI:
             body,
             text="Say the folder name. Then say: desktop / downloads / documents / home, or say: confirm. Say: cancel to stop.",
             text_color=self.colors.muted,
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=self._form_font(10),
             wraplength=520,
             justify="left",
         )
         hint.pack(anchor="w", padx=14, pady=(0, 12))
 
-        self._voice_form["window"] = win
-        self._voice_form["name_label"] = name_label
-        self._voice_form["loc_label"] = loc_label
+        self._voice_form.window = win
+        self._voice_form.name_label = name_label
+        self._voice_form.loc_label = loc_label
 
         try:
             self.voice_engine.speak("What should I name the folder?")
@@ -2893,13 +3394,7 @@ class FridayGUI:
         if self._voice_form:
             return
 
-        self._voice_form = {
-            "mode": "move_folder",
-            "step": "source",
-            "src": "",
-            "dst": "",
-            "on_conflict": "Rename",
-        }
+        self._voice_form = _VoiceForm(mode="move_folder", step="source")
 
         win = ctk.CTkToplevel(self.root)
         win.title("Move Folder (Voice)")
@@ -2912,7 +3407,7 @@ class FridayGUI:
             win,
             text="MOVE FOLDER",
             text_color=self.colors.accent,
-            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            font=self._form_font(14, "bold"),
         )
         title.pack(anchor="w", padx=16, pady=(16, 8))
 
@@ -2923,7 +3418,7 @@ class FridayGUI:
             body,
             text="Source: (waiting…)",
             text_color=self.colors.text,
-            font=ctk.CTkFont(family="Consolas", size=11, weight="bold"),
+            font=self._form_font(11, "bold"),
             wraplength=640,
             justify="left",
         )
@@ -2933,7 +3428,7 @@ class FridayGUI:
             body,
             text="Destination: (waiting…)",
             text_color=self.colors.text,
-            font=ctk.CTkFont(family="Consolas", size=11, weight="bold"),
+            font=self._form_font(11, "bold"),
             wraplength=640,
             justify="left",
         )
@@ -2943,15 +3438,15 @@ class FridayGUI:
             body,
             text="Say the source folder path. Then say the destination folder path. Say: confirm to move. Say: cancel to stop.",
             text_color=self.colors.muted,
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=self._form_font(10),
             wraplength=640,
             justify="left",
         )
         hint.pack(anchor="w", padx=14, pady=(0, 12))
 
-        self._voice_form["window"] = win
-        self._voice_form["src_label"] = src_label
-        self._voice_form["dst_label"] = dst_label
+        self._voice_form.window = win
+        self._voice_form.src_label = src_label
+        self._voice_form.dst_label = dst_label
 
         try:
             self.voice_engine.speak("Tell me the source folder path.")
@@ -2974,16 +3469,18 @@ class FridayGUI:
             self._voice_form_reset()
             return
 
-        if form.get("mode") == "create_folder":
+        if form.mode == "create_folder":
             self._voice_form_handle_create_folder(text)
             return
-        if form.get("mode") == "move_folder":
+        if form.mode == "move_folder":
             self._voice_form_handle_move_folder(text)
             return
 
     def _voice_form_handle_create_folder(self, text: str):
-        form = self._voice_form or {}
-        step = form.get("step")
+        form = self._voice_form
+        if form is None:
+            return
+        step = form.step
 
         if step == "name":
             name = self._extract_folder_name(text)
@@ -2994,10 +3491,10 @@ class FridayGUI:
                     pass
                 return
 
-            form["name"] = name
-            form["step"] = "location_or_confirm"
+            form.name = name
+            form.step = "location_or_confirm"
             try:
-                lbl = form.get("name_label")
+                lbl = form.name_label
                 if lbl:
                     lbl.configure(text=f"Name: {name}")
             except Exception:
@@ -3020,10 +3517,10 @@ class FridayGUI:
 
             loc = self._location_from_speech(text)
             if loc:
-                loc = os.path.expanduser(loc)
-                form["dest_dir"] = loc
+                loc = self._expand_home(loc)
+                form.dest_dir = loc
                 try:
-                    lbl = form.get("loc_label")
+                    lbl = form.loc_label
                     if lbl:
                         lbl.configure(text=f"Location: {loc}")
                 except Exception:
@@ -3046,8 +3543,8 @@ class FridayGUI:
         form = self._voice_form
         if not form:
             return
-        name = (form.get("name") or "").strip()
-        dest_dir = (form.get("dest_dir") or "").strip()
+        name = form.name.strip()
+        dest_dir = form.dest_dir.strip()
         if not name:
             return
 
@@ -3081,12 +3578,14 @@ class FridayGUI:
                 pass
 
     def _voice_form_handle_move_folder(self, text: str):
-        form = self._voice_form or {}
-        step = form.get("step")
+        form = self._voice_form
+        if form is None:
+            return
+        step = form.step
 
         if step == "source":
             src = self._location_from_speech(text) or text.strip()
-            src = os.path.expanduser(src)
+            src = self._expand_home(src)
             if not os.path.isdir(src):
                 self.log("Source not found; waiting again.")
                 try:
@@ -3094,10 +3593,10 @@ class FridayGUI:
                 except Exception:
                     pass
                 return
-            form["src"] = src
-            form["step"] = "destination"
+            form.src = src
+            form.step = "destination"
             try:
-                lbl = form.get("src_label")
+                lbl = form.src_label
                 if lbl:
                     lbl.configure(text=f"Source: {src}")
             except Exception:
@@ -3112,7 +3611,7 @@ class FridayGUI:
 
         if step == "destination":
             dst = self._location_from_speech(text) or text.strip()
-            dst = os.path.expanduser(dst)
+            dst = self._expand_home(dst)
             if not os.path.isdir(dst):
                 self.log("Destination not found; waiting again.")
                 try:
@@ -3122,10 +3621,10 @@ class FridayGUI:
                 except Exception:
                     pass
                 return
-            form["dst"] = dst
-            form["step"] = "confirm"
+            form.dst = dst
+            form.step = "confirm"
             try:
-                lbl = form.get("dst_label")
+                lbl = form.dst_label
                 if lbl:
                     lbl.configure(text=f"Destination: {dst}")
             except Exception:
@@ -3145,10 +3644,10 @@ class FridayGUI:
                 except Exception:
                     pass
                 return
-            src = form.get("src") or ""
-            dst = form.get("dst") or ""
+            src = form.src
+            dst = form.dst
             self.log(f"Voice move confirmed: {src} -> {dst}")
-            self.start_folder_move(src=src, dst=dst, on_conflict=form.get("on_conflict", "Rename"))
+            self.start_folder_move(src=src, dst=dst, on_conflict=form.on_conflict)
             try:
                 self.voice_engine.speak("Moving now.")
             except Exception:
@@ -3192,8 +3691,6 @@ class FridayGUI:
             self._cmd_history_idx = None
             return
         self._cmd_history.append(t)
-        if len(self._cmd_history) > 200:
-            self._cmd_history = self._cmd_history[-200:]
         self._cmd_history_idx = None
 
     def _history_prev(self):
@@ -3230,9 +3727,13 @@ class FridayGUI:
         self.command_entry.insert(0, text)
 
     def _handle_local_text_commands(self, text: str) -> bool:
-        try:
-            parts = shlex.split(text)
-        except Exception:
+        # shlex only matters for quotes/escapes; plain commands split directly.
+        if '"' in text or "'" in text or "\\" in text:
+            try:
+                parts = shlex.split(text)
+            except Exception:
+                parts = text.split()
+        else:
             parts = text.split()
 
         if not parts:
@@ -3330,101 +3831,150 @@ class FridayGUI:
         self.toast("Added to download queue.", level="ok")
         self._yt_enqueue(url=url, out_dir=out_dir, mode=mode)
 
-    def _download_youtube_once(self, url: str, out_dir: str, mode: str):
+    def _get_ydl(self, yt_dlp, out_dir: str, mode: str):
+        """Return a YoutubeDL instance for (out_dir, mode), reusing the last one.
+
+        Only called from the download worker thread.
+        """
+        key = (out_dir, mode)
+        if self._ydl is not None and self._ydl_key == key:
+            return self._ydl
+        self._close_ydl()
+
+        ydl_opts = {
+            **_YDL_MODE_OPTS.get(mode, _YDL_DEFAULT_OPTS),
+            "outtmpl": os.path.join(out_dir, "%(title)s.%(ext)s"),
+            "progress_hooks": [self._yt_progress_hook],
+        }
+
+        self._ydl = yt_dlp.YoutubeDL(ydl_opts)
+        self._ydl_key = key
+        return self._ydl
+
+    def _close_ydl(self):
+        ydl = self._ydl
+        self._ydl = None
+        self._ydl_key = None
+        if ydl is None:
+            return
         try:
-            try:
-                import yt_dlp  # type: ignore
-            except Exception:
-                yt_dlp = None
+            ydl.close()
+        except Exception:
+            pass
+
+    def _yt_progress_hook(self, d):
+        status = d.get("status")
+        if status == "finished":
+            filename = d.get("filename")
+            if filename:
+                self._last_download_path = filename
+                self.root.after(0, lambda: self.yt_open_last_button.configure(state="normal"))
+                self.root.after(0, self._yt_queue_render)
+            return
+        if status != "downloading":
+            return
+        last_progress = self._yt_last_progress
+        now = time.monotonic()
+        if now - last_progress["t"] < 0.6:
+            return
+        downloaded = d.get("downloaded_bytes") or 0
+        eta = d.get("eta")
+        # Stalled ticks (same 64 KiB bucket, same ETA) don't reach Tk at all.
+        key = (int(downloaded) >> 16, int(eta or 0))
+        if key == last_progress["key"]:
+            return
+        last_progress["key"] = key
+        last_progress["t"] = now
+        # Formatting happens on the UI thread, only for updates that survive
+        # the throttle. A newer tick just replaces the pending values; only
+        # the first one since the last flush schedules a callback.
+        self._yt_pending_progress = (
+            downloaded,
+            d.get("total_bytes") or d.get("total_bytes_estimate") or 0,
+            d.get("speed") or 0,
+            eta,
+        )
+        if not self._yt_progress_scheduled:
+            self._yt_progress_scheduled = True
+            self.root.after_idle(self._yt_flush_progress)
+
+    def _yt_flush_progress(self):
+        self._yt_progress_scheduled = False
+        pending, self._yt_pending_progress = self._yt_pending_progress, None
+        if pending is not None:
+            self._yt_show_progress(*pending)
+
+    def _yt_show_progress(self, downloaded, total, speed, eta):
+        pct = (downloaded / total * 100.0) if total else 0.0
+        msg = (
+            f"Downloading… {pct:5.1f}% | {self._human_bytes(speed)}/s | ETA {eta}s"
+            if eta
+            else f"Downloading… {pct:5.1f}%"
+        )
+        if msg == self._yt_last_progress["msg"]:
+            return
+        self._yt_last_progress["msg"] = msg
+        self.update_status(msg, self.colors.warn)
+
+    def _download_youtube_once(self, urls: list[str], out_dir: str, mode: str):
+        try:
+            # Heavy import (extractors, websockets, ...): first download only.
+            yt_dlp = _lazy("yt_dlp")
 
             if yt_dlp is None:
                 self.root.after(
                     0,
-                    lambda: self.log(
-                        "yt-dlp not installed. Install with: pip install yt-dlp"
-                    ),
+                    self._finalize_download,
+                    "yt-dlp not installed. Install with: pip install yt-dlp",
                 )
                 return
 
-            outtmpl = os.path.join(out_dir, "%(title)s.%(ext)s")
-            ydl_opts: dict = {"outtmpl": outtmpl, "noplaylist": True}
-
-            if mode == "Audio (mp3)":
-                ydl_opts.update(
-                    {
-                        "format": "bestaudio/best",
-                        "postprocessors": [
-                            {
-                                "key": "FFmpegExtractAudio",
-                                "preferredcodec": "mp3",
-                                "preferredquality": "192",
-                            }
-                        ],
-                    }
-                )
-            elif mode == "Video (mp4)":
-                ydl_opts.update({"format": "bv*+ba/best", "merge_output_format": "mp4"})
-            else:
-                ydl_opts.update({"format": "bv*+ba/best"})
-
-            last_progress = {"t": 0.0, "msg": ""}
-
-            def hook(d):
-                status = d.get("status")
-                if status == "finished":
-                    filename = d.get("filename")
-                    if filename:
-                        self._last_download_path = filename
-                        self.root.after(0, lambda: self.yt_open_last_button.configure(state="normal"))
-                        self.root.after(0, self._yt_queue_render)
-                    return
-                if status != "downloading":
-                    return
-                now = time.time()
-                if now - last_progress["t"] < 0.6:
-                    return
-                total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
-                downloaded = d.get("downloaded_bytes") or 0
-                pct = (downloaded / total * 100.0) if total else 0.0
-                speed = d.get("speed") or 0
-                eta = d.get("eta")
-                msg = (
-                    f"Downloading… {pct:5.1f}% | {self._human_bytes(speed)}/s | ETA {eta}s"
-                    if eta
-                    else f"Downloading… {pct:5.1f}%"
-                )
-                if msg == last_progress["msg"]:
-                    return
-                last_progress["t"] = now
-                last_progress["msg"] = msg
-                self.root.after(0, lambda m=msg: self.update_status(m, self.colors.warn))
-
-            ydl_opts["progress_hooks"] = [hook]
+            self._yt_last_progress = {"t": 0.0, "msg": "", "key": None}
+            ydl = self._get_ydl(yt_dlp, out_dir, mode)
 
             self.root.after(0, lambda: self.log(f"Saving to: {out_dir}"))
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-
-            self.root.after(0, lambda: self.log("Download complete."))
-            self.root.after(0, lambda: self.toast("Download complete.", level="ok"))
+            # One download() per URL: the options have no ignoreerrors, so a
+            # private or removed video raises and would take the rest of the
+            # batch (already popped from the queue) down with it.
+            failed = []
+            for url in urls:
+                try:
+                    ydl.download([url])
+                except Exception as e:
+                    failed.append(url)
+                    self.log(f"Download failed for {url}: {e}")
+                    # It may be in a bad state; the next URL gets a fresh one.
+                    self._close_ydl()
+                    ydl = self._get_ydl(yt_dlp, out_dir, mode)
+
+            error = None
+            if failed:
+                error = f"{len(failed)} of {len(urls)} URL(s) failed; see log."
+            self.root.after(0, self._finalize_download, error)
         except Exception as e:
-            self.root.after(0, lambda: self.log(f"Download failed: {e}"))
-            self.root.after(0, lambda: self.toast("Download failed.", level="error"))
-        finally:
-            self.root.after(0, lambda: self.update_status("Ready", self.colors.ok))
-            self.root.after(0, self._yt_queue_render)
+            # Drop the cached instance; it may be in a bad state after a failure.
+            self._close_ydl()
+            self.root.after(0, self._finalize_download, str(e))
+
+    def _finalize_download(self, error: str | None):
+        # One UI-thread hop for all end-of-download updates.
+        if error is None:
+            self.log("Download complete.")
+            self.toast("Download complete.", level="ok")
+        else:
+            self.log(f"Download failed: {error}")
+            self.toast("Download failed.", level="error")
+        self.update_status("Ready", self.colors.ok)
+        self._yt_queue_render()
 
     def _human_bytes(self, n: float) -> str:
         try:
             n = float(n)
         except Exception:
             return "0B"
-        units = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        while n >= 1024 and i < len(units) - 1:
-            n /= 1024.0
-            i += 1
-        return f"{n:.1f}{units[i]}"
+        # Each unit step is 10 bits, so the bit length picks the unit directly.
+        i = min((int(n).bit_length() - 1) // 10, 4) if n >= 1024 else 0
+        return f"{n / (1 << (10 * i)):.1f}{_BYTE_UNITS[i]}"
 
     # ---------------------------
     # Folder move
@@ -3450,10 +4000,10 @@ class FridayGUI:
                 "Missing paths", "Choose a source and destination folder."
             )
             return
-        if not os.path.isdir(src):
+        if not self._isdir_cached(src):
             messagebox.showerror("Invalid source", "Source folder does not exist.")
             return
-        if not os.path.isdir(dst):
+        if not self._isdir_cached(dst):
             messagebox.showerror("Invalid destination", "Destination folder does not exist.")
             return
 
@@ -3465,79 +4015,98 @@ class FridayGUI:
         self.update_status("Moving…", self.colors.warn)
         self.log(f"Move requested: {src} -> {dst}")
 
+        try:
+            preserve_meta = bool(self.move_preserve_meta.get())
+        except Exception:
+            preserve_meta = False
+
         self._move_thread = threading.Thread(
             target=self._move_folder_worker,
-            args=(src, dst, on_conflict),
+            args=(src, dst, on_conflict, preserve_meta),
             daemon=True,
         )
         self._move_thread.start()
 
-    def _move_folder_worker(self, src: str, dst: str, on_conflict: str):
+    def _isdir_cached(self, path: str, ttl: float = 1.0) -> bool:
+        # Only hits are cached: a folder the user just created must not be
+        # reported missing, while a stale hit is caught by the move itself.
+        key = os.path.normcase(os.path.abspath(path))
+        now = time.monotonic()
+        seen = self._isdir_cache.get(key)
+        if seen is not None and now - seen < ttl:
+            return True
+        if not _is_dir(path):
+            self._isdir_cache.pop(key, None)
+            return False
+        if len(self._isdir_cache) > 128:
+            self._isdir_cache = {k: t for k, t in self._isdir_cache.items() if now - t < ttl}
+        self._isdir_cache[key] = now
+        return True
+
+    def _move_folder_worker(
+        self, src: str, dst: str, on_conflict: str, preserve_meta: bool = False
+    ):
+        notes: list[str] = []
         try:
-            base = os.path.basename(os.path.normpath(src))
+            # abspath() calls getcwd() each time; resolve relative paths
+            # against one snapshot instead.
+            cwd = os.getcwd()
+            src_abs = os.path.normpath(os.path.join(cwd, src))
+            base = os.path.basename(src_abs)
             dest_path = os.path.join(dst, base)
 
-            if os.path.abspath(src) == os.path.abspath(dest_path):
+            if src_abs == os.path.join(os.path.normpath(os.path.join(cwd, dst)), base):
                 raise RuntimeError("Source and destination are the same folder.")
 
-            if os.path.exists(dest_path):
+            if _stat_or_none(dest_path) is not None:
                 if on_conflict == "Fail":
                     raise FileExistsError(f"Destination already exists: {dest_path}")
                 ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
                 dest_path = os.path.join(dst, f"{base}-moved-{ts}")
-                self.root.after(
-                    0, lambda: self.log(f"Destination exists; renaming to: {dest_path}")
-                )
+                notes.append(f"Destination exists; renaming to: {dest_path}")
 
-            shutil.move(src, dest_path)
-            self.root.after(0, lambda: self.log(f"Move complete: {dest_path}"))
-            self.root.after(0, lambda: self.toast("Move complete.", level="ok"))
+            # Same volume: a single rename. Only cross-device moves need
+            # shutil.move's copy + delete.
+            try:
+                os.rename(src, dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # copy2 adds utime/xattr syscalls per file; plain copy keeps
+                # contents and permission bits, which is enough for most moves.
+                copy_function = shutil.copy2 if preserve_meta else shutil.copy
+                if os.path.islink(src):
+                    shutil.move(src, dest_path, copy_function=copy_function)
+                else:
+                    _copy_tree_parallel(src, dest_path, copy_function=copy_function)
+                    leftovers = _fast_rmtree(src)
+                    if leftovers:
+                        notes.append(
+                            f"Copied, but {len(leftovers)} source item(s) could not be removed, "
+                            f"e.g. {leftovers[0]}"
+                        )
+            self.root.after(0, self._finalize_move, True, dest_path, notes)
         except Exception as e:
-            self.root.after(0, lambda: self.log(f"Move failed: {e}"))
-            self.root.after(0, lambda: self.toast("Move failed.", level="error"))
-        finally:
-            self.root.after(0, lambda: self.update_status("Ready", self.colors.ok))
-            self.root.after(0, lambda: self.move_button.configure(state="normal"))
+            self.root.after(0, self._finalize_move, False, str(e), notes)
+
+    def _finalize_move(self, ok: bool, detail: str, notes: list[str]):
+        # One UI-thread hop for all end-of-move updates.
+        for note in notes:
+            self.log(note)
+        if ok:
+            self.log(f"Move complete: {detail}")
+            self.toast("Move complete.", level="ok")
+        else:
+            self.log(f"Move failed: {detail}")
+            self.toast("Move failed.", level="error")
+        self.update_status("Ready", self.colors.ok)
+        self.move_button.configure(state="normal")
 
     # ---------------------------
     # Help
     # ---------------------------
     def show_help(self):
-        help_text = (
-            "FRIDAY COMMAND GUIDE\n"
-            "====================\n\n"
-            "Voice commands depend on your local CommandProcessor.\n"
-            "Typed commands always work in the Console tab.\n\n"
-            "VOICE POPUPS (NO KEYBOARD):\n"
-            "  - Say: create a new folder\n"
-            "    - Then say the folder name\n"
-            "    - Then say: desktop / downloads / documents / home, or say: confirm\n"
-            "  - Say: move folder\n"
-            "    - Then say the source folder path\n"
-            "    - Then say the destination folder path (parent folder)\n"
-            "    - Then say: confirm\n"
-            "  - Say: cancel to stop\n\n"
-            "TYPED COMMANDS:\n"
-            "  download <url> [out_dir]\n"
-            "  move \"<src_folder>\" \"<dst_folder>\"\n\n"
-            "UI FEATURES:\n"
-            "  - YouTube tab: download video/audio (requires yt-dlp + ffmpeg for mp3)\n"
-            "  - Files tab: move a folder to another location\n\n"
-            "NOTES:\n"
-            "  - Only download content you own or have permission to download.\n"
-        )
-
-        win = ctk.CTkToplevel(self.root)
-        win.title("Help")
-        win.geometry("700x520")
-        win.configure(fg_color=self.colors.bg)
-
-        box = ctk.CTkTextbox(
-            win, fg_color=self.colors.bg, text_color=self.colors.text, font=("Consolas", 11)
-        )
-        box.pack(fill="both", expand=True, padx=14, pady=14)
-        box.insert("end", help_text)
-        box.configure(state="disabled")
+        self._show_text_window("help", "Help", "700x520", _HELP_TEXT)
 
     def show_dependency_help(self):
         err = self.command_processor_error or "Unknown import error."
@@ -3549,10 +4118,25 @@ class FridayGUI:
             "Then run:\n"
             "  python main.py\n"
         )
+        self._show_text_window("deps", "Fix Dependencies", "760x420", text)
+
+    def _show_text_window(self, key: str, title: str, geometry: str, text: str):
+        # Built once and withdrawn on close; reopening just re-shows it.
+        win = self._text_windows.get(key)
+        try:
+            if win is not None and win.winfo_exists():
+                win.deiconify()
+                win.lift()
+                win.focus_force()
+                return
+        except Exception:
+            pass
+
         win = ctk.CTkToplevel(self.root)
-        win.title("Fix Dependencies")
-        win.geometry("760x420")
+        win.title(title)
+        win.geometry(geometry)
         win.configure(fg_color=self.colors.bg)
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
 
         box = ctk.CTkTextbox(
             win, fg_color=self.colors.bg, text_color=self.colors.text, font=("Consolas", 11)
@@ -3560,6 +4144,7 @@ class FridayGUI:
         box.pack(fill="both", expand=True, padx=14, pady=14)
         box.insert("end", text)
         box.configure(state="disabled")
+        self._text_windows[key] = win
 
 
 def main():
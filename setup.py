@@ -3,11 +3,26 @@
 Setup and test script for the Personal Voice Assistant
 """
 
+import hashlib
+import importlib.util
+import shutil
 import subprocess
 import sys
-import platform
 import os
 
+# sha256 of the requirements.txt that was last installed successfully.
+REQ_HASH_FILE = os.path.join('.setup_cache', 'req.sha256')
+
+MODULES = [
+    ('tkinter', 'Tkinter (GUI)'),
+    ('pyttsx3', 'pyttsx3 (Text-to-Speech)'),
+    ('speech_recognition', 'SpeechRecognition'),
+    ('pyaudio', 'PyAudio (Audio)'),
+    ('pyautogui', 'PyAutoGUI (GUI Automation)'),
+    ('requests', 'Requests (HTTP)'),
+    ('bs4', 'BeautifulSoup (Web Scraping)'),
+]
+
 def print_header(text):
     """Print formatted header."""
     print("\n" + "="*60)
@@ -15,10 +30,14 @@ def print_header(text):
     print("="*60 + "\n")
 
 def run_command(cmd, description):
-    """Run a command and report results."""
+    """Run a command (an argv list, no shell) and report results.
+
+    stdout goes straight to the terminal so long installs show progress;
+    only stderr is kept, for the failure message.
+    """
     print(f"▶ {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, stderr=subprocess.PIPE, text=True)
         if result.returncode == 0:
             print(f"✓ {description} successful\n")
             return True
@@ -34,13 +53,14 @@ def check_requirements():
     print_header("Checking Requirements")
     
     # Check Python version
-    print(f"Python Version: {sys.version}")
+    print("Python Version: {}.{}.{}".format(*sys.version_info[:3]))
     if sys.version_info < (3, 7):
         print("✗ Python 3.7 or higher is required")
         return False
     print("✓ Python version OK\n")
     
-    # Check system
+    # Check system (platform is only needed here)
+    import platform
     system = platform.system()
     print(f"Operating System: {system}")
     
@@ -53,6 +73,51 @@ def check_requirements():
     
     return True
 
+def requirements_satisfied(path='requirements.txt'):
+    """True when every requirement in `path` is already installed at an
+    acceptable version, checked against installed metadata only."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # Python 3.7
+        return False
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        Requirement = None
+    
+    with open(path) as f:
+        lines = [line.split('#', 1)[0].strip() for line in f]
+    for line in lines:
+        if not line:
+            continue
+        if line.startswith('-'):  # -r/-e/--index-url etc.: let pip handle it
+            return False
+        if Requirement is not None:
+            try:
+                req = Requirement(line)
+            except Exception:
+                return False
+            if req.marker is not None and not req.marker.evaluate():
+                continue
+            name, wanted = req.name, req.specifier
+        else:
+            # Without packaging, only plain "name" and "name==version" lines.
+            name, sep, pinned = line.partition('==')
+            name, pinned = name.strip(), pinned.strip()
+            if not name.replace('-', '').replace('_', '').replace('.', '').isalnum():
+                return False
+            wanted = None
+        try:
+            installed = version(name)
+        except PackageNotFoundError:
+            return False
+        if Requirement is not None:
+            if not wanted.contains(installed, prereleases=True):
+                return False
+        elif sep and installed != pinned:
+            return False
+    return True
+
 def install_dependencies():
     """Install Python dependencies."""
     print_header("Installing Dependencies")
@@ -62,29 +127,61 @@ def install_dependencies():
         print("✗ requirements.txt not found")
         return False
     
-    return run_command("pip install -r requirements.txt", "Installing packages")
+    # Skip pip entirely when requirements.txt hasn't changed since the last
+    # successful install and every checked module is still installed.
+    with open('requirements.txt', 'rb') as f:
+        req_hash = hashlib.sha256(f.read()).hexdigest()
+    try:
+        with open(REQ_HASH_FILE) as f:
+            installed_hash = f.read().strip()
+    except OSError:
+        installed_hash = None
+    if installed_hash == req_hash and all(
+        importlib.util.find_spec(module) for module, _ in MODULES
+    ):
+        print("✓ requirements.txt unchanged since last install, skipping pip\n")
+        return True
+    
+    # No (or a stale) marker, e.g. a fresh checkout in an existing venv: if
+    # the installed versions already match, there's still nothing to do.
+    if requirements_satisfied():
+        print("✓ All requirements already installed, skipping pip\n")
+    else:
+        if not _pip_install():
+            return False
+    try:
+        os.makedirs(os.path.dirname(REQ_HASH_FILE), exist_ok=True)
+        with open(REQ_HASH_FILE, 'w') as f:
+            f.write(req_hash)
+    except OSError:
+        pass
+    return True
+
+def _pip_install():
+    """Install requirements.txt with uv if present, otherwise pip."""
+    # uv resolves and installs much faster than pip when it's around. Either
+    # way prefer wheels over building from source; don't forbid sdists
+    # outright, PyAudio has no Linux wheels.
+    uv = shutil.which("uv")
+    if uv:
+        cmd = [uv, "pip", "install", "--python", sys.executable, "-r", "requirements.txt"]
+    else:
+        cmd = [sys.executable, "-m", "pip", "install", "--prefer-binary", "-r", "requirements.txt"]
+    return run_command(cmd, "Installing packages")
 
 def test_imports():
     """Test if all imports work."""
     print_header("Testing Imports")
     
-    modules = [
-        ('tkinter', 'Tkinter (GUI)'),
-        ('pyttsx3', 'pyttsx3 (Text-to-Speech)'),
-        ('speech_recognition', 'SpeechRecognition'),
-        ('pyaudio', 'PyAudio (Audio)'),
-        ('pyautogui', 'PyAutoGUI (GUI Automation)'),
-        ('requests', 'Requests (HTTP)'),
-        ('bs4', 'BeautifulSoup (Web Scraping)'),
-    ]
-    
+    # Presence check only: find_spec locates each module without running
+    # its top-level code (pyautogui alone pulls in the whole X11 stack).
+    # The microphone and TTS steps exercise the ones that matter at runtime.
     all_ok = True
-    for module, name in modules:
-        try:
-            __import__(module)
-            print(f"✓ {name} imported successfully")
-        except ImportError as e:
-            print(f"✗ {name} failed: {e}")
+    for module, name in MODULES:
+        if importlib.util.find_spec(module) is not None:
+            print(f"✓ {name} found")
+        else:
+            print(f"✗ {name} not installed")
             all_ok = False
     
     print()
@@ -95,19 +192,38 @@ def test_microphone():
     print_header("Testing Microphone")
     
     try:
-        import speech_recognition as sr
+        import pyaudio
         
-        mic_indices = sr.Microphone.list_microphone_indexes()
-        print(f"Found {len(mic_indices)} microphone(s):")
-        
-        for i in mic_indices:
-            try:
-                with sr.Microphone(device_index=i) as source:
-                    print(f"  Device {i}: Available")
-            except:
-                print(f"  Device {i}: Not accessible")
+        # One PortAudio session for the whole probe: sr.Microphone starts
+        # (and tears down) PortAudio again for every device it opens.
+        pa = pyaudio.PyAudio()
+        try:
+            inputs = []
+            for i in range(pa.get_device_count()):
+                info = pa.get_device_info_by_index(i)
+                if info.get('maxInputChannels', 0) > 0:
+                    inputs.append(info)
+            print(f"Found {len(inputs)} microphone(s):")
+            
+            for info in inputs:
+                i = info['index']
+                try:
+                    stream = pa.open(
+                        format=pyaudio.paInt16,
+                        channels=1,
+                        rate=int(info['defaultSampleRate']),
+                        input=True,
+                        input_device_index=i,
+                        frames_per_buffer=1024,
+                    )
+                    stream.close()
+                    print(f"  Device {i} ({info['name']}): Available")
+                except Exception:
+                    print(f"  Device {i} ({info['name']}): Not accessible")
+        finally:
+            pa.terminate()
         
-        if not mic_indices:
+        if not inputs:
             print("✗ No microphones detected")
             return False
         
@@ -118,17 +234,45 @@ def test_microphone():
         print(f"✗ Microphone test failed: {e}\n")
         return False
 
-def test_tts():
-    """Test text-to-speech."""
+# pyttsx3 drivers (SAPI5/COM, NSSpeech) must be used from the thread that
+# created the engine, so init and say() both run on this one worker.
+_tts_thread = None
+
+def _tts_executor():
+    """The TTS worker, created (and concurrent.futures imported) on first use
+    so runs that stop before the TTS steps never pay for it."""
+    global _tts_thread
+    if _tts_thread is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _tts_thread = ThreadPoolExecutor(max_workers=1)
+    return _tts_thread
+
+def _init_tts():
+    """Create the pyttsx3 engine and load its voice list."""
+    import pyttsx3
+    
+    engine = pyttsx3.init()
+    engine.getProperty('voices')
+    return engine
+
+def _say(engine, text):
+    engine.say(text)
+    engine.runAndWait()
+
+def test_tts(engine_future=None):
+    """Test text-to-speech.
+
+    engine_future: a pending _init_tts() started earlier on the TTS worker, so
+    the driver has been loading while the other steps ran.
+    """
     print_header("Testing Text-to-Speech")
     
     try:
-        import pyttsx3
-        
-        engine = pyttsx3.init()
+        if engine_future is None:
+            engine_future = _tts_executor().submit(_init_tts)
         print("Initializing TTS engine...")
-        engine.say("Text to speech is working")
-        engine.runAndWait()
+        engine = engine_future.result()
+        _tts_executor().submit(_say, engine, "Text to speech is working").result()
         print("✓ TTS test passed\n")
         return True
     
@@ -158,13 +302,17 @@ def main():
         print("✗ Import test failed")
         return False
     
+    # Load the TTS driver in the background while the microphone is probed
+    # and the user answers the prompt below.
+    tts_engine = _tts_executor().submit(_init_tts)
+    
     # Step 4: Test microphone
     test_microphone()
     
     # Step 5: Test TTS
     response = input("Do you want to test text-to-speech? (y/n): ").lower()
     if response == 'y':
-        test_tts()
+        test_tts(tts_engine)
     
     # Success
     print_header("Setup Complete!")
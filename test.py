@@ -1,21 +1,142 @@
+import audioop  # stdlib <= 3.12, audioop-lts on 3.13+
+import collections
+import sys
+import threading
+
 try:
+    import pyaudio
     import speech_recognition as sr
 except ImportError:
-    print("Missing dependency: speech_recognition. Install dependencies with:\n  pip install -r requirements.txt")
+    print("Missing dependency: speech_recognition/PyAudio. Install dependencies with:\n  pip install -r requirements.txt")
     raise
 
+# Optional: transcribe locally with faster-whisper instead of a Google round trip.
+try:
+    from faster_whisper import WhisperModel
+    import numpy as np
+except ImportError:
+    WhisperModel = None
 
-r = sr.Recognizer()
-# Force a standard 48k sample rate to match Kali's PipeWire
-with sr.Microphone(sample_rate=48000) as source:
-    print("Mic is OPEN. Calibrating...")
-    # Give it a very short window
-    r.adjust_for_ambient_noise(source, duration=0.5)
-    print("Speak now, sir!")
-    
+# 16 kHz is what Google and Whisper work at, so capture there and move a
+# third of the bytes; 48 kHz (Kali's PipeWire default) if the device refuses.
+RATES = (16000, 48000)
+# Fixed speech threshold (RMS) instead of calibrating for 0.5 s on every run;
+# raise it if a noisy room keeps triggering.
+ENERGY_THRESHOLD = 300
+SILENCE_FRAMES = 500 // 30  # this much quiet ends the phrase
+PREROLL_FRAMES = 300 // 30  # kept from before onset so the first syllable isn't cut
+
+
+def transcribe(audio):
+    if WhisperModel is None:
+        return r.recognize_google(audio)
+    model = WhisperModel("base.en", device="cpu", compute_type="int8")
+    pcm = audio.get_raw_data(convert_rate=16000, convert_width=2)
+    samples = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+    segments, _ = model.transcribe(samples, beam_size=1, vad_filter=True)
+    return "".join(seg.text for seg in segments).strip()
+
+
+def input_device(pa):
+    """Device index to record from, or None for PortAudio's default.
+
+    PyAudio already asks for the device's low-latency setting; on Windows the
+    default device is an MME one, whose "low" latency is still far above
+    WASAPI's, so use the WASAPI default input when there is one.
+    """
+    if sys.platform != "win32":
+        return None
     try:
-        audio = r.listen(source, timeout=5)
+        index = pa.get_host_api_info_by_type(pyaudio.paWASAPI)["defaultInputDevice"]
+    except (OSError, KeyError):
+        return None
+    return index if index >= 0 else None
+
+
+def capture(timeout=5):
+    """Record one phrase. PortAudio calls back every 30 ms and the speech
+    gate (audioop RMS, in C) runs right there, so the main thread just waits
+    for the phrase to end instead of pulling chunks through listen()."""
+    pre = collections.deque(maxlen=PREROLL_FRAMES)
+    phrase = []
+    done = threading.Event()
+    frames = quiet = 0
+    speech = False
+    wait_frames = timeout * 1000 // 30
+
+    # audioop.rms already does the per-frame energy in C; NumPy would add an
+    # array, a widening copy and a reduction for 30 ms of samples. Plain
+    # closure variables keep the rest of the callback cheap.
+    def callback(in_data, frame_count, time_info, status):
+        nonlocal frames, quiet, speech
+        frames += 1
+        loud = audioop.rms(in_data, 2) > ENERGY_THRESHOLD
+        if speech:
+            phrase.append(in_data)
+            quiet = 0 if loud else quiet + 1
+            if quiet >= SILENCE_FRAMES:
+                done.set()
+                return (None, pyaudio.paComplete)
+        elif loud:
+            speech = True
+            phrase.extend(pre)
+            phrase.append(in_data)
+        elif frames >= wait_frames:
+            done.set()
+            return (None, pyaudio.paComplete)
+        else:
+            pre.append(in_data)
+        return (None, pyaudio.paContinue)
+
+    pa = pyaudio.PyAudio()
+    device = input_device(pa)
+    # Shared-mode WASAPI only opens at the device's mix format rate (often
+    # 44.1 kHz), so try that too, and as a last resort PortAudio's default.
+    attempts = [(device, rate) for rate in RATES]
+    if device is not None:
+        try:
+            native = int(pa.get_device_info_by_index(device)["defaultSampleRate"])
+        except (OSError, KeyError, ValueError):
+            native = None
+        if native and native not in RATES:
+            attempts.append((device, native))
+        attempts += [(None, rate) for rate in RATES]
+    for i, (dev, rate) in enumerate(attempts):
+        try:
+            stream = pa.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=rate,
+                input=True,
+                input_device_index=dev,
+                frames_per_buffer=rate * 30 // 1000,  # 30 ms per callback
+                stream_callback=callback,
+            )
+            break
+        except (OSError, ValueError):
+            if i == len(attempts) - 1:
+                pa.terminate()
+                raise
+    try:
+        stream.start_stream()
+        print("Mic is OPEN. Speak now, sir!")
+        done.wait(timeout + 30)
+    finally:
+        stream.stop_stream()
+        stream.close()
+        pa.terminate()
+    if not phrase:
+        return None
+    return sr.AudioData(b"".join(phrase), rate, 2)
+
+
+r = sr.Recognizer()
+try:
+    audio = capture(timeout=5)
+    if audio is None:
+        print("Error: no speech heard")
+    else:
         print("Got audio! Recognizing...")
-        print("You said: " + r.recognize_google(audio))
-    except Exception as e:
-        print(f"Error: {e}")
\ No newline at end of file
+        print("You said: " + transcribe(audio))
+except Exception as e:
+    print(f"Error: {e}")
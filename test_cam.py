@@ -1,18 +1,88 @@
+import sys
+import threading
+import time
+
 import cv2
 
-cap = cv2.VideoCapture(0)  # try 0, then 1, then 2 if needed
+# Same setup as Friday's camera tab: explicit backend, MJPG at a fixed
+# 640x480@30 (raw YUYV at the camera's max resolution is far heavier per
+# frame), and a 1-frame buffer so the preview doesn't lag behind.
+backend = cv2.CAP_DSHOW if sys.platform == "win32" else cv2.CAP_V4L2
+cap = cv2.VideoCapture(0, backend)  # try 0, then 1, then 2 if needed
+if not cap.isOpened():
+    cap.release()
+    cap = cv2.VideoCapture(0)
 if not cap.isOpened():
     print("Camera index 0 cannot be opened")
 else:
     print("Camera 0 opened OK")
-    while True:
-        ok, frame = cap.read()
-        if not ok:
-            print("Failed to read frame")
-            break
-        cv2.imshow("Camera test", frame)
-        if cv2.waitKey(1) & 0xFF == 27:  # ESC to quit
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    cap.set(cv2.CAP_PROP_FPS, 30)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    # Capture runs on its own thread and publishes only the newest frame;
+    # the main thread (imshow must stay there on macOS) draws it. Grabbing
+    # nonstop keeps the driver queue empty, so nothing stale builds up while
+    # a frame is on screen. (Draining the queue from the display loop instead
+    # doesn't work: the only way to tell a queued frame from a live one is to
+    # grab again, and when the queue is empty that second grab blocks for a
+    # whole frame interval, halving the rate.) retrieve() returns a fresh
+    # array each time, so swapping the reference under the lock is all the
+    # buffering needed.
+    lock = threading.Lock()
+    running = threading.Event()
+    running.set()
+    latest = None
+    published = 0
+
+    def grab_frames():
+        global latest, published
+        frame_count = 0
+        t_start = time.perf_counter()
+        while running.is_set():
+            if not cap.grab():
+                print("Failed to read frame")
+                break
+            frame_count += 1
+            # Report the rate the camera actually delivers.
+            if frame_count % 300 == 0:
+                now = time.perf_counter()
+                print(f"{300 / (now - t_start):.1f} fps")
+                t_start = now
+            # This is a capture test: only every third frame is decoded and
+            # drawn (imshow uploads the whole image, waitKey spins the GUI).
+            if frame_count % 3:
+                continue
+            ok, frame = cap.retrieve()
+            if not ok:
+                print("Failed to decode frame")
+                break
+            # Cameras that ignore the 640x480 request are scaled down here,
+            # off the GUI thread, so the window never blits a full-size frame.
+            h, w = frame.shape[:2]
+            if w > 640:
+                frame = cv2.resize(frame, (640, h * 640 // w), interpolation=cv2.INTER_AREA)
+            with lock:
+                latest = frame
+                published += 1
+        running.clear()
+
+    grabber = threading.Thread(target=grab_frames, daemon=True)
+    grabber.start()
+
+    shown = 0
+    while running.is_set():
+        with lock:
+            frame, n = latest, published
+        if n != shown:
+            shown = n
+            cv2.imshow("Camera test", frame)
+        if cv2.waitKey(10) & 0xFF == 27:  # ESC to quit
             break
+    running.clear()
+    grabber.join(timeout=1.0)
 
 cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+cv2.destroyAllWindows()